@@ -48,24 +48,59 @@ __description__ = "Natural Language to Formal Logic Converter with Inference Eng
 # PUBLIC API EXPORTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# Mode 1: Direct usage
-from .api import TextToLogicProcessor
-
-# Mode 2: Internal API
-from .api import convert_text, deduce_all, analyze_text
-
-# Mode 3: Library usage (recommended)
-from .api import LogicSystem
-
-# Core components (for advanced usage)
-from .text_to_logic import TextToLogicConverter, SystemVerifier
-from .logic_engine import LogicEngine, InferenceResult, DerivationChain
-from .logic_parser import Atom, LogicalExpression, LogicalOperator, parse_expression
-from .deduction_rules import (
-    ModusPonens, ModusTollens, HypotheticalSyllogism,
-    DisjunctiveSyllogism, Simplification, Conjunction,
-    Resolution, BiconditionalElimination, RuleManager
-)
+# Exported names are resolved lazily (PEP 562): submodules are only imported
+# the first time one of their names is accessed, so importing the package
+# for __version__ or get_version() stays cheap.
+_LAZY = {
+    # Mode 1: Direct usage
+    'TextToLogicProcessor': ('.api', 'TextToLogicProcessor'),
+    
+    # Mode 2: Internal API
+    'convert_text': ('.api', 'convert_text'),
+    'deduce_all': ('.api', 'deduce_all'),
+    'analyze_text': ('.api', 'analyze_text'),
+    'analyze_texts': ('.api', 'analyze_texts'),
+    
+    # Mode 3: Library usage (recommended)
+    'LogicSystem': ('.api', 'LogicSystem'),
+    
+    # Core components (for advanced usage)
+    'TextToLogicConverter': ('.text_to_logic', 'TextToLogicConverter'),
+    'SystemVerifier': ('.text_to_logic', 'SystemVerifier'),
+    'LogicEngine': ('.logic_engine', 'LogicEngine'),
+    'InferenceResult': ('.logic_engine', 'InferenceResult'),
+    'DerivationChain': ('.logic_engine', 'DerivationChain'),
+    'Atom': ('.logic_parser', 'Atom'),
+    'AtomIndex': ('.logic_parser', 'AtomIndex'),
+    'LogicalExpression': ('.logic_parser', 'LogicalExpression'),
+    'LogicalOperator': ('.logic_parser', 'LogicalOperator'),
+    'parse_expression': ('.logic_parser', 'parse_expression'),
+    'parse_many': ('.logic_parser', 'parse_many'),
+    'ModusPonens': ('.deduction_rules', 'ModusPonens'),
+    'ModusTollens': ('.deduction_rules', 'ModusTollens'),
+    'HypotheticalSyllogism': ('.deduction_rules', 'HypotheticalSyllogism'),
+    'DisjunctiveSyllogism': ('.deduction_rules', 'DisjunctiveSyllogism'),
+    'Simplification': ('.deduction_rules', 'Simplification'),
+    'Conjunction': ('.deduction_rules', 'Conjunction'),
+    'Resolution': ('.deduction_rules', 'Resolution'),
+    'BiconditionalElimination': ('.deduction_rules', 'BiconditionalElimination'),
+    'RuleManager': ('.deduction_rules', 'RuleManager'),
+}
+
+
+def __getattr__(name: str):
+    """Import exported names on first access."""
+    if name in _LAZY:
+        import importlib
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -81,6 +116,7 @@ __all__ = [
     'convert_text',
     'deduce_all',
     'analyze_text',
+    'analyze_texts',
     
     # Core components
     'TextToLogicConverter',
@@ -91,9 +127,11 @@ __all__ = [
     
     # Logic structures
     'Atom',
+    'AtomIndex',
     'LogicalExpression',
     'LogicalOperator',
     'parse_expression',
+    'parse_many',
     
     # Deduction rules
     'ModusPonens',
@@ -132,6 +170,8 @@ def verify_system(model_name: str = "gemma:2b") -> bool:
     Returns:
         True if all dependencies are OK
     """
+    from .text_to_logic import SystemVerifier
+    
     verifier = SystemVerifier()
     all_ok, messages = verifier.verify_system(model_name)
     
@@ -18,23 +18,69 @@ Version: 1.0
 # IMPORTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing import List, Tuple, Dict, Optional, Union
+from typing import List, Tuple, Dict, FrozenSet, Optional, Set, Union
 from dataclasses import dataclass
-from text_to_logic import TextToLogicConverter, SystemVerifier
-from logic_engine import LogicEngine, InferenceResult
-from logic_parser import Atom, LogicalExpression
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+
+try:
+    from .text_to_logic import TextToLogicConverter, SystemVerifier, HTTP_POOL_SIZE, _read_text_file
+    from .logic_engine import LogicEngine, InferenceResult, _console_logger
+    from .logic_parser import Atom, LogicalExpression
+except ImportError:
+    # Running as a standalone script (python api.py)
+    from text_to_logic import TextToLogicConverter, SystemVerifier, HTTP_POOL_SIZE, _read_text_file
+    from logic_engine import LogicEngine, InferenceResult, _console_logger
+    from logic_parser import Atom, LogicalExpression
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
 class ConversionResult:
-    """Result of text-to-logic conversion."""
-    facts: List[str]
-    rules: List[str]
-    source_text: str
+    """
+    Result of text-to-logic conversion.
+    
+    The source text can be given directly or as a file path, in which case
+    it is only read from disk the first time source_text is accessed.
+    """
+    __slots__ = ('facts', 'rules', '_source_path', '_source_text')
+    
+    def __init__(self, facts: List[str], rules: List[str],
+                 source_text: Optional[str] = None, source_path: Optional[str] = None):
+        """
+        Initialize the conversion result.
+        
+        Args:
+            facts: Extracted facts
+            rules: Extracted rules
+            source_text: Original text, if already in memory
+            source_path: Path to the original text file, read lazily
+        """
+        self.facts = facts
+        self.rules = rules
+        self._source_path = source_path
+        self._source_text = source_text
+    
+    @property
+    def source_text(self) -> Optional[str]:
+        """Original text, loaded from source_path on first access."""
+        if self._source_text is None and self._source_path is not None:
+            self._source_text = _read_text_file(self._source_path, ('utf-8',))
+        return self._source_text
+    
+    def __repr__(self):
+        return f"ConversionResult(facts={self.facts!r}, rules={self.rules!r})"
+    
+    def __eq__(self, other):
+        if not isinstance(other, ConversionResult):
+            return NotImplemented
+        return (self.facts == other.facts and
+                self.rules == other.rules and
+                self.source_text == other.source_text)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -45,26 +91,66 @@ class ConversionResult:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class CompleteAnalysis:
     """Complete analysis result including conversion and inference."""
+    # Hand-written slots: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('conversion', 'inference', '_counts')
+    
     conversion: ConversionResult
     inference: InferenceResult
     
+    def __post_init__(self):
+        object.__setattr__(self, '_counts', None)
+    
+    @property
+    def as_dict(self) -> Dict:
+        """
+        Dictionary form of this analysis.
+        
+        The analysis is frozen, so the inference counts are computed on
+        first access and kept; each access builds a new dictionary from
+        them, so callers may modify what they get.
+        """
+        if self._counts is None:
+            object.__setattr__(self, '_counts', self._inference_counts())
+        return {
+            'conversion': self.conversion.to_dict(),
+            'inference': dict(self._counts)
+        }
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
+        return self.as_dict
+    
+    def _inference_counts(self) -> Dict:
+        """Count the parts of the inference result."""
         return {
-            'conversion': self.conversion.to_dict(),
-            'inference': {
-                'original_facts_count': len(self.inference.original_facts),
-                'original_rules_count': len(self.inference.original_rules),
-                'derived_facts_count': len(self.inference.derived_facts),
-                'iterations': self.inference.iterations,
-                'has_contradictions': len(self.inference.contradictions) > 0
-            }
+            'original_facts_count': len(self.inference.original_facts),
+            'original_rules_count': len(self.inference.original_rules),
+            'derived_facts_count': len(self.inference.derived_facts),
+            'iterations': self.inference.iterations,
+            'has_contradictions': len(self.inference.contradictions) > 0
         }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROGRESS OUTPUT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_LOG = logging.getLogger(__name__)
+
+_SEPARATOR = "=" * 70
+_BANNER_PROCESSOR = (
+    "╔══════════════════════════════════════════════════════════════════════════════╗\n"
+    "║                    TEXT2LOGIC PROCESSOR                                       ║\n"
+    "╚══════════════════════════════════════════════════════════════════════════════╝\n"
+)
+_STEP_CONVERT = "STEP 1: Converting text to logic format...\n" + _SEPARATOR
+_STEP_INFER = "\n\nSTEP 2: Performing logical inference...\n" + _SEPARATOR
+_STEP_EXPORT = "\n\nSTEP 3: Exporting inference results...\n" + _SEPARATOR
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MODE 1: DIRECT USAGE API
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -116,24 +202,20 @@ class TextToLogicProcessor:
             CompleteAnalysis if perform_inference=True, None otherwise
         """
         if verbose:
-            print("╔══════════════════════════════════════════════════════════════════════════════╗")
-            print("║                    TEXT2LOGIC PROCESSOR                                       ║")
-            print("╚══════════════════════════════════════════════════════════════════════════════╝\n")
+            _console_logger(_LOG)
+            _LOG.info(_BANNER_PROCESSOR)
+            _LOG.info(_STEP_CONVERT)
         
         # Convert text to logic
-        if verbose:
-            print("STEP 1: Converting text to logic format...")
-            print("=" * 70)
         
-        self.converter.convert_file(input_file, output_file, verbose=verbose)
+        facts, rules = self.converter.convert_file(input_file, output_file, verbose=verbose)
         
         if not perform_inference:
             return None
         
         # Perform inference
         if verbose:
-            print("\n\nSTEP 2: Performing logical inference...")
-            print("=" * 70)
+            _LOG.info(_STEP_INFER)
         
         self.engine.clear()
         self.engine.load_from_file(output_file)
@@ -141,33 +223,16 @@ class TextToLogicProcessor:
         
         # Export inference results
         if verbose:
-            print("\n\nSTEP 3: Exporting inference results...")
-            print("=" * 70)
+            _LOG.info(_STEP_EXPORT)
         
         inference_output = output_file.replace('.inf', '_inferred.txt')
         self.engine.export_results(inference_output, result)
         
         if verbose:
-            print(f"✓ Inference results saved to: {inference_output}")
-        
-        # Read original text
-        with open(input_file, 'r', encoding='utf-8') as f:
-            source_text = f.read()
-        
-        # Read facts and rules
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            facts = []
-            rules = []
-            for line in content.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if line.startswith('Rule:'):
-                        rules.append(line)
-                    else:
-                        facts.append(line)
-        
-        conversion = ConversionResult(facts=facts, rules=rules, source_text=source_text)
+            _LOG.info("✓ Inference results saved to: %s", inference_output)
+        
+        # Original text is read lazily, only if the caller asks for it
+        conversion = ConversionResult(facts=facts, rules=rules, source_path=input_file)
         
         return CompleteAnalysis(conversion=conversion, inference=result)
 
@@ -176,6 +241,36 @@ class TextToLogicProcessor:
 # MODE 2: INTERNAL API (BETWEEN MODULES)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Shared converters, one per model, reused across convert_text/analyze_text calls
+_CONVERTER_POOL: Dict[str, TextToLogicConverter] = {}
+_CONVERTER_POOL_LOCK = threading.Lock()
+
+
+def _get_converter(model_name: str) -> TextToLogicConverter:
+    """
+    Get the shared converter for a model, creating it on first use.
+    
+    Converters only hold their model name, references to the module-level
+    prompt and regex constants of text_to_logic and an HTTP session, so
+    creating one is cheap and pooled instances are safe to share between
+    threads; sharing them also shares their open connections to Ollama.
+    
+    Args:
+        model_name: Ollama model to use
+    
+    Returns:
+        Pooled TextToLogicConverter instance
+    """
+    converter = _CONVERTER_POOL.get(model_name)
+    if converter is None:
+        with _CONVERTER_POOL_LOCK:
+            converter = _CONVERTER_POOL.get(model_name)
+            if converter is None:
+                converter = TextToLogicConverter(model_name=model_name)
+                _CONVERTER_POOL[model_name] = converter
+    return converter
+
+
 def convert_text(text: str, model_name: str = "gemma:2b", verbose: bool = False) -> Tuple[List[str], List[str]]:
     """
     Convert text to logic format (facts and rules).
@@ -193,8 +288,17 @@ def convert_text(text: str, model_name: str = "gemma:2b", verbose: bool = False)
         >>> print(facts)
         ['(Pedro)IsA(estudiante)']
     """
-    converter = TextToLogicConverter(model_name=model_name)
-    return converter.convert_text(text, verbose=verbose)
+    # Repeated texts are served from the pooled converter's per-sentence
+    # cache. It only keeps successful conversions, so sentences that failed
+    # (e.g. while Ollama was unreachable) are converted again next time.
+    return _get_converter(model_name).convert_text(text, verbose=verbose)
+
+
+def _strip_rule_prefix(rule: str) -> str:
+    """Remove a leading "Rule:" marker, if present."""
+    if rule.startswith('Rule:'):
+        return rule[5:].lstrip()
+    return rule
 
 
 def deduce_all(facts: List[str], rules: List[str], verbose: bool = False) -> InferenceResult:
@@ -216,14 +320,9 @@ def deduce_all(facts: List[str], rules: List[str], verbose: bool = False) -> Inf
         >>> print(len(result.derived_facts))
     """
     engine = LogicEngine()
-    
-    for fact in facts:
-        engine.add_fact(fact)
-    
-    for rule in rules:
-        # Remove "Rule:" prefix if present
-        rule = rule.replace('Rule:', '').strip()
-        engine.add_rule(rule)
+    engine.add_facts(facts)
+    # Converter output has no prefix, but accept hand-written "Rule: ..." too
+    engine.add_rules(map(_strip_rule_prefix, rules))
     
     return engine.infer_all(verbose=verbose)
 
@@ -255,6 +354,43 @@ def analyze_text(text: str, model_name: str = "gemma:2b", verbose: bool = False)
     return CompleteAnalysis(conversion=conversion, inference=result)
 
 
+def analyze_texts(texts: List[str], model_name: str = "gemma:2b",
+                  workers: int = 8) -> List[CompleteAnalysis]:
+    """
+    Complete analysis of several independent texts.
+    
+    Conversions are I/O-bound (waiting on the LLM), so they are fanned out
+    across a thread pool sharing the pooled converter; inference then runs
+    per text. Each text converts its sentences one at a time, so at most
+    workers requests are in flight, within the converter's HTTP pool.
+    
+    Args:
+        texts: Input texts
+        model_name: Ollama model to use
+        workers: Maximum number of concurrent conversions (at most HTTP_POOL_SIZE)
+    
+    Returns:
+        List of CompleteAnalysis, in the same order as texts
+    
+    Example:
+        >>> analyses = analyze_texts(["Pedro es estudiante.", "Bob trabaja en Microsoft."])
+        >>> print(len(analyses))
+        2
+    """
+    converter = _get_converter(model_name)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, HTTP_POOL_SIZE))) as executor:
+        conversions = list(executor.map(
+            lambda text: converter.convert_text(text, verbose=False, max_concurrency=1), texts))
+    
+    analyses = []
+    for text, (facts, rules) in zip(texts, conversions):
+        result = deduce_all(facts, rules)
+        conversion = ConversionResult(facts=facts, rules=rules, source_text=text)
+        analyses.append(CompleteAnalysis(conversion=conversion, inference=result))
+    
+    return analyses
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MODE 3: LIBRARY IMPORT (FOR EXTERNAL PROGRAMS)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -286,10 +422,29 @@ class LogicSystem:
         self.converter = TextToLogicConverter(model_name=model_name)
         self.engine = LogicEngine()
         self._inference_result = None
+        self._query_cache = lru_cache(maxsize=4096)(self.engine.query)
+        self._str_cache: Optional[List[str]] = None
+        self._all_facts_cache: Optional[List[str]] = None
+        self._fact_index: Optional[FrozenSet[str]] = None
+        self._seen_facts: Set[str] = set()
+        self._seen_rules: Set[str] = set()
+        self._dirty = True
         
         if auto_verify:
             self.verify()
     
+    def _invalidate_caches(self):
+        """Drop cached query answers and fact strings after a KB change."""
+        self._query_cache.cache_clear()
+        self._str_cache = None
+        self._all_facts_cache = None
+        self._fact_index = None
+    
+    def _mark_dirty(self):
+        """Record that the knowledge base changed since the last inference."""
+        self._dirty = True
+        self._invalidate_caches()
+    
     def verify(self) -> bool:
         """
         Verify system dependencies.
@@ -309,12 +464,18 @@ class LogicSystem:
         """
         facts, rules = self.converter.convert_text(text, verbose=verbose)
         
-        for fact in facts:
-            self.engine.add_fact(fact)
+        # Skip statements the system has already seen (overlapping sentences)
+        new_facts = list(dict.fromkeys(f for f in facts if f not in self._seen_facts))
+        new_rules = list(dict.fromkeys(r for r in rules if r not in self._seen_rules))
+        if not new_facts and not new_rules:
+            return
         
-        for rule in rules:
-            rule = rule.replace('Rule:', '').strip()
-            self.engine.add_rule(rule)
+        self.engine.add_facts(new_facts)
+        self.engine.add_rules(new_rules)
+        self._seen_facts.update(new_facts)
+        self._seen_rules.update(new_rules)
+        
+        self._mark_dirty()
     
     def add_fact(self, fact: str):
         """
@@ -323,7 +484,11 @@ class LogicSystem:
         Args:
             fact: Fact in logic notation
         """
+        if fact in self._seen_facts:
+            return
         self.engine.add_fact(fact)
+        self._seen_facts.add(fact)
+        self._mark_dirty()
     
     def add_rule(self, rule: str):
         """
@@ -332,7 +497,11 @@ class LogicSystem:
         Args:
             rule: Rule in logic notation
         """
+        if rule in self._seen_rules:
+            return
         self.engine.add_rule(rule)
+        self._seen_rules.add(rule)
+        self._mark_dirty()
     
     def infer_all(self, verbose: bool = False):
         """
@@ -340,8 +509,15 @@ class LogicSystem:
         
         Args:
             verbose: Print inference progress
+        
+        Inference is skipped when nothing was added since the last run.
         """
+        if not self._dirty and self._inference_result is not None:
+            return
+        
         self._inference_result = self.engine.infer_all(verbose=verbose)
+        self._dirty = False
+        self._invalidate_caches()
     
     def get_conclusions(self) -> List[str]:
         """
@@ -353,7 +529,10 @@ class LogicSystem:
         if self._inference_result is None:
             return []
         
-        return [str(chain.conclusion) for chain in self._inference_result.derived_facts]
+        if self._str_cache is None:
+            self._str_cache = list(map(str, (chain.conclusion for chain in
+                                             self._inference_result.derived_facts)))
+        return list(self._str_cache)
     
     def get_all_facts(self) -> List[str]:
         """
@@ -363,10 +542,12 @@ class LogicSystem:
             List of all facts
         """
         if self._inference_result is None:
-            return [str(f) for f in self.engine.original_facts]
+            return list(map(str, self.engine.original_facts))
         
-        all_facts = self._inference_result.get_all_facts()
-        return [str(f) for f in all_facts]
+        if self._all_facts_cache is None:
+            all_facts = self._inference_result.get_all_facts()
+            self._all_facts_cache = list(map(str, all_facts))
+        return list(self._all_facts_cache)
     
     def query(self, query: str) -> bool:
         """
@@ -378,7 +559,14 @@ class LogicSystem:
         Returns:
             True if fact is known
         """
-        return self.engine.query(query)
+        if self._inference_result is not None and not self._dirty:
+            # Canonical spellings are answered from the string index
+            # without parsing; anything else falls back to the engine.
+            if self._fact_index is None:
+                self._fact_index = frozenset(map(str, self.engine.knowledge_base))
+            if query in self._fact_index:
+                return True
+        return self._query_cache(query)
     
     def get_statistics(self) -> Dict:
         """
@@ -400,7 +588,7 @@ class LogicSystem:
             'original_facts': len(self._inference_result.original_facts),
             'original_rules': len(self._inference_result.original_rules),
             'derived_facts': len(self._inference_result.derived_facts),
-            'total_facts': len(self._inference_result.get_all_facts()),
+            'total_facts': self._inference_result.count_all_facts(),
             'iterations': self._inference_result.iterations,
             'has_contradictions': len(self._inference_result.contradictions) > 0
         }
@@ -421,6 +609,9 @@ class LogicSystem:
         """Clear all knowledge from the system."""
         self.engine.clear()
         self._inference_result = None
+        self._seen_facts.clear()
+        self._seen_rules.clear()
+        self._mark_dirty()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
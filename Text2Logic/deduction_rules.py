@@ -16,8 +16,298 @@ Version: 1.0
 # IMPORTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing import List, Set, Tuple, Optional
-from logic_parser import Atom, LogicalExpression, LogicalOperator
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, combinations, count, product
+from operator import itemgetter
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Union
+
+try:
+    from .logic_parser import Atom, AtomIndex, LogicalExpression, LogicalOperator, KIND_ATOM
+except ImportError:
+    # Running as a standalone script (python deduction_rules.py)
+    from logic_parser import Atom, AtomIndex, LogicalExpression, LogicalOperator, KIND_ATOM
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# KNOWLEDGE BASE INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Conjunction stops pairing atoms above this many (pairs grow quadratically)
+CONJUNCTION_MAX_FACTS = 20
+
+# Generation numbers of IndexedKB contents (a new one on every full reindex)
+_INDEX_GENERATIONS = count()
+
+# Extra keys of a knowledge base index, next to the LogicalOperator buckets;
+# atoms are bucketed under their kind tag
+KB_ATOMS = KIND_ATOM
+KB_ALL = 'all'
+
+
+def build_kb_index(knowledge_base: Iterable) -> Dict:
+    """
+    Bucket a knowledge base by operator in a single pass.
+    
+    Args:
+        knowledge_base: Set of known facts and rules
+    
+    Returns:
+        defaultdict(list) mapping each LogicalOperator to its expressions,
+        KB_ATOMS to the atoms and KB_ALL to the knowledge base set itself
+        (used for membership tests)
+    """
+    knowledge_base = ensure_set(knowledge_base)
+    
+    kb_index = defaultdict(list)
+    for item in knowledge_base:
+        kb_index[item.kind].append(item)
+    kb_index[KB_ALL] = knowledge_base
+    return kb_index
+
+
+def ensure_set(knowledge_base: Iterable) -> Set:
+    """Return knowledge_base itself if it is a set, else a set of its items."""
+    if isinstance(knowledge_base, (set, frozenset)):
+        return knowledge_base
+    return set(knowledge_base)
+
+
+def ensure_kb_index(knowledge_base: Union[Dict, Set, None]) -> Optional[Dict]:
+    """Return knowledge_base unchanged if already indexed (or None), else index it."""
+    if knowledge_base is None or isinstance(knowledge_base, dict):
+        return knowledge_base
+    return build_kb_index(knowledge_base)
+
+
+def semi_naive_groups(kb_index: Dict, delta_index: Optional[Dict],
+                      left_key, right_key=None) -> List[Tuple]:
+    """
+    Split a two-premise rule's search space for semi-naive evaluation.
+    
+    Without a delta every left premise meets every right premise. With one,
+    only pairs that use a fact derived in the last round can produce anything
+    new: new left × all right, plus old left × new right.
+    
+    Args:
+        kb_index: Index of the whole knowledge base
+        delta_index: Index of last round's additions, or None for a full pass
+        left_key: Index key of the first premise (e.g. LogicalOperator.IMPLIES)
+        right_key: Index key of the second premise; None pairs the left
+            premises with the index itself
+    
+    Returns:
+        List of (left_premises, right_premises) groups to combine
+    """
+    def right(index):
+        return index if right_key is None else index[right_key]
+    
+    if delta_index is None:
+        return [(kb_index[left_key], right(kb_index))]
+    
+    delta = delta_index[KB_ALL]
+    old_left = [item for item in kb_index[left_key] if item not in delta]
+    return [(delta_index[left_key], right(kb_index)),
+            (old_left, right(delta_index))]
+
+
+def head_key(term):
+    """
+    Key an implication antecedent can only be satisfied under.
+    
+    Atoms are keyed by (relation, arity), the AtomIndex key; compound
+    expressions only match themselves, so they are their own key.
+    """
+    if term.kind is KIND_ATOM:
+        return term.relation, len(term.objects)
+    return term
+
+
+class IndexedKB(defaultdict):
+    """
+    Knowledge base index kept up to date as facts are added.
+    
+    Has the layout of build_kb_index() (operator buckets, KB_ATOMS, and the
+    knowledge base set under KB_ALL), so rules take it as a kb_index, plus
+    an AtomIndex of the atoms for predicate lookups. Facts added through
+    add()/update() are indexed on the spot; facts added to the set
+    directly are picked up by sync().
+    
+    Contradictions (an atom P next to ¬P) are recorded as their second
+    half is indexed, so finding them never takes a scan.
+    """
+    
+    def __init__(self, knowledge_base: Optional[Set] = None):
+        """
+        Args:
+            knowledge_base: Set to index and add to (a new one if omitted)
+        """
+        super().__init__(list)
+        self[KB_ALL] = set() if knowledge_base is None else knowledge_base
+        self.atom_buckets = AtomIndex()
+        # Negations of atoms by the atom they negate, and the contradicting
+        # ones found so far (an insertion-ordered set)
+        self._negation_of = {}
+        self._contradictions = {}
+        # Kinds of the implication antecedents (what Modus Ponens can match),
+        # and the implications by head_key() of their antecedent, each with
+        # its position in the index
+        self.antecedent_kinds = set()
+        self.implications_by_head = defaultdict(list)
+        self._indexed = 0
+        self.generation = next(_INDEX_GENERATIONS)
+        self.sync()
+    
+    def _index(self, fact):
+        kind = fact.kind
+        self[kind].append(fact)
+        if kind is KIND_ATOM:
+            self.atom_buckets.add(fact)
+            negation = self._negation_of.get(fact)
+            if negation is not None:
+                self._contradictions[negation] = fact
+        elif kind is LogicalOperator.NOT:
+            negated = fact.operands[0]
+            if negated.kind is KIND_ATOM:
+                self._negation_of[negated] = fact
+                if negated in self[KB_ALL]:
+                    self._contradictions[fact] = negated
+        elif kind is LogicalOperator.IMPLIES:
+            antecedent = fact.operands[0]
+            self.antecedent_kinds.add(antecedent.kind)
+            self.implications_by_head[head_key(antecedent)].append((self._indexed, fact))
+        self._indexed += 1
+    
+    @property
+    def contradictions(self) -> List[Tuple]:
+        """(atom, negation) pairs both present in the knowledge base."""
+        self.sync()
+        return [(atom, negation) for negation, atom in self._contradictions.items()]
+    
+    def add(self, fact):
+        """Add a fact to the knowledge base and the index."""
+        knowledge_base = self[KB_ALL]
+        if fact not in knowledge_base:
+            knowledge_base.add(fact)
+            self._index(fact)
+    
+    def update(self, facts: Iterable):
+        """Add several facts to the knowledge base and the index."""
+        knowledge_base = self[KB_ALL]
+        fresh = [fact for fact in ensure_set(facts) if fact not in knowledge_base]
+        # One bulk update lets the set grow its table once for the batch
+        knowledge_base.update(fresh)
+        for fact in fresh:
+            self._index(fact)
+    
+    def sync(self, added: Optional[Set] = None):
+        """
+        Index facts that were added to the knowledge base set directly.
+        
+        Args:
+            added: Facts added to the set since the index was last current;
+                if they do not account for its growth, everything is reindexed
+        """
+        knowledge_base = self[KB_ALL]
+        if self._indexed == len(knowledge_base):
+            return
+        if added is not None and self._indexed + len(added) == len(knowledge_base):
+            for fact in added:
+                self._index(fact)
+            return
+        
+        for key in [key for key in self if key != KB_ALL]:
+            del self[key]
+        self.atom_buckets = AtomIndex()
+        self._negation_of = {}
+        self._contradictions = {}
+        self.antecedent_kinds = set()
+        self.implications_by_head = defaultdict(list)
+        self._indexed = 0
+        self.generation = next(_INDEX_GENERATIONS)
+        for fact in knowledge_base:
+            self._index(fact)
+    
+    def signature(self, kinds: Optional[Iterable]) -> Tuple:
+        """
+        Version of the buckets for the given kinds (None for the whole index).
+        
+        Buckets only grow until a full reindex, which starts a new generation,
+        so equal signatures mean those buckets have not changed.
+        """
+        if kinds is None:
+            return self.generation, len(self[KB_ALL])
+        return self.generation, tuple(len(self.get(kind, ())) for kind in kinds)
+    
+    def iter_matching(self, pattern: Atom) -> Iterable:
+        """Atoms that might unify with pattern (see AtomIndex.candidates())."""
+        return self.atom_buckets.candidates(pattern)
+    
+    def implications_triggered_by(self, facts: Iterable) -> List:
+        """
+        Implications whose antecedent could be satisfied by one of facts.
+        
+        Implications whose antecedent predicate none of the facts has are
+        never looked at. The result keeps the order of the index.
+        """
+        by_head = self.implications_by_head
+        entries = []
+        for head in {head_key(fact) for fact in facts}:
+            entries.extend(by_head.get(head, ()))
+        entries.sort(key=itemgetter(0))
+        return [impl for _, impl in entries]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JUSTIFICATIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Justification:
+    """
+    Justification of a derived fact, formatted only when first displayed.
+    
+    Rules record a format string and the premises; the text is built the first
+    time the derivation is printed or exported. It compares, hashes and
+    formats like that text, and string methods are forwarded to it.
+    """
+    
+    __slots__ = ('template', 'premises', '_text')
+    
+    def __init__(self, template: str, *premises):
+        """
+        Args:
+            template: str.format template with one {} per premise
+            premises: Facts, rules and conclusion referenced by the template
+        """
+        self.template = template
+        self.premises = premises
+        self._text = None
+    
+    def __str__(self):
+        if self._text is None:
+            self._text = self.template.format(*self.premises)
+        return self._text
+    
+    def __repr__(self):
+        return repr(str(self))
+    
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+    
+    def __eq__(self, other):
+        if isinstance(other, Justification):
+            other = str(other)
+        return str(self) == other
+    
+    def __hash__(self):
+        return hash(str(self))
+    
+    def __getattr__(self, name):
+        # Only reached for names the class lacks; private ones (e.g. a slot
+        # not yet set while unpickling) must not recurse through __str__
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(str(self), name)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -27,6 +317,11 @@ from logic_parser import Atom, LogicalExpression, LogicalOperator
 class DeductionRule:
     """Base class for all deduction rules."""
     
+    # Kinds of knowledge base entries the rule's premises are drawn from,
+    # used by RuleNetwork to skip rules no new fact can trigger; None means
+    # any kind (e.g. Modus Ponens, whose antecedent may be any expression)
+    premise_kinds = None
+    
     def __init__(self, name: str, priority: int = 5):
         """
         Initialize a deduction rule.
@@ -38,19 +333,36 @@ class DeductionRule:
         self.name = name
         self.priority = priority
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """
         Apply this rule to the knowledge base.
         
         Args:
-            knowledge_base: Set of known facts and rules
+            kb_index: Knowledge base index from build_kb_index (a plain set
+                of facts and rules is also accepted and indexed on the fly)
             new_facts: Set to collect newly derived facts
+            delta_index: Index of the facts added in the previous round; when
+                given, only derivations using at least one of them are tried
+            seen: Set the rule records the premises (or resolvents) it has
+                fully used in. Passing the same set to later calls on the same,
+                growing knowledge base lets them skip those; by default each
+                call starts from an empty one.
         
         Returns:
             List of tuples: (new_fact, justification)
         """
         raise NotImplementedError("Subclasses must implement apply()")
     
+    def trigger_kinds(self, kb_index: Dict) -> Optional[Iterable]:
+        """
+        Kinds of new facts that can trigger this rule on the given knowledge base.
+        
+        Defaults to premise_kinds; rules with data-dependent premises narrow
+        it down from the index.
+        """
+        return self.premise_kinds
+    
     def __repr__(self):
         return f"{self.name} (priority: {self.priority})"
 
@@ -72,51 +384,84 @@ class ModusPonens(DeductionRule):
     def __init__(self):
         super().__init__("Modus Ponens", priority=10)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Modus Ponens rule."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
         # Find all implications in knowledge base
-        implications = [item for item in knowledge_base 
-                       if isinstance(item, LogicalExpression) and 
-                       item.operator == LogicalOperator.IMPLIES]
+        implications = kb_index[LogicalOperator.IMPLIES]
+        if not implications:
+            return derived
+        
+        if isinstance(kb_index, IndexedKB) and delta_index is not None:
+            # Old implications only need another look if the delta has a
+            # fact with the predicate of their antecedent
+            delta = delta_index[KB_ALL]
+            old_impls = [impl for impl in kb_index.implications_triggered_by(delta)
+                         if impl not in delta]
+            groups = [(delta_index[LogicalOperator.IMPLIES], kb_index),
+                      (old_impls, delta_index)]
+        else:
+            groups = semi_naive_groups(kb_index, delta_index, LogicalOperator.IMPLIES)
+        
+        for impls, facts_index in groups:
+            if impls:
+                self._apply_group(impls, facts_index, knowledge_base,
+                                  new_facts, derived)
         
-        # Find all facts in knowledge base
-        facts = [item for item in knowledge_base 
-                if isinstance(item, Atom) or 
-                (isinstance(item, LogicalExpression) and 
-                 item.operator != LogicalOperator.IMPLIES)]
+        return derived
+    
+    def trigger_kinds(self, kb_index: Dict) -> Optional[Iterable]:
+        """New implications, or new facts of a kind some antecedent has."""
+        if not isinstance(kb_index, IndexedKB):
+            return None
+        return (LogicalOperator.IMPLIES, *kb_index.antecedent_kinds)
+    
+    def _apply_group(self, implications: List, facts_index: Dict,
+                     knowledge_base: Set, new_facts: Set, derived: List[Tuple]):
+        """Fire implications against the facts of one index (whole KB or delta)."""
+        if isinstance(facts_index, IndexedKB):
+            buckets = facts_index.atom_buckets
+        else:
+            buckets = AtomIndex(facts_index[KB_ATOMS])
         
         for impl in implications:
             antecedent = impl.operands[0]
             consequent = impl.operands[1]
             
-            # Check if antecedent is in facts
-            for fact in facts:
-                if self._match(antecedent, fact):
-                    # Apply substitution if there are variables
-                    if isinstance(antecedent, Atom) and isinstance(fact, Atom):
-                        matches, bindings = antecedent.matches(fact)
-                        if matches:
-                            # Substitute in consequent
-                            new_fact = self._substitute(consequent, bindings)
-                            if new_fact not in knowledge_base and new_fact not in new_facts:
-                                justification = f"Modus Ponens: {fact} ∧ ({impl}) ⊢ {new_fact}"
-                                derived.append((new_fact, justification))
-                                new_facts.add(new_fact)
-                    elif self._equals(antecedent, fact):
-                        if consequent not in knowledge_base and consequent not in new_facts:
-                            justification = f"Modus Ponens: {fact} ∧ ({impl}) ⊢ {consequent}"
-                            derived.append((consequent, justification))
-                            new_facts.add(consequent)
-        
-        return derived
+            if antecedent.kind is not KIND_ATOM:
+                # Compound antecedents fire only on an identical fact
+                if (antecedent.operator != LogicalOperator.IMPLIES and
+                        antecedent in facts_index[KB_ALL]):
+                    self._derive(antecedent, impl, consequent,
+                                 knowledge_base, new_facts, derived)
+                continue
+            
+            for fact in buckets.candidates(antecedent):
+                # Shared memoized bindings: only read by _substitute
+                bindings = antecedent.unifier(fact)
+                if bindings is not None:
+                    # Substitute in consequent
+                    new_fact = self._substitute(consequent, bindings)
+                    self._derive(fact, impl, new_fact,
+                                 knowledge_base, new_facts, derived)
+    
+    def _derive(self, fact, impl, new_fact, knowledge_base: Set,
+                new_facts: Set, derived: List[Tuple]):
+        """Record new_fact, concluded from fact and impl, unless already known."""
+        if new_fact not in knowledge_base and new_fact not in new_facts:
+            justification = Justification("Modus Ponens: {} ∧ ({}) ⊢ {}", fact, impl, new_fact)
+            derived.append((new_fact, justification))
+            new_facts.add(new_fact)
     
     def _match(self, expr1, expr2) -> bool:
         """Check if two expressions match."""
-        if isinstance(expr1, Atom) and isinstance(expr2, Atom):
-            matches, _ = expr1.matches(expr2)
-            return matches
+        if expr1.kind is KIND_ATOM and expr2.kind is KIND_ATOM:
+            return expr1.unifier(expr2) is not None
         return self._equals(expr1, expr2)
     
     def _equals(self, expr1, expr2) -> bool:
@@ -124,13 +469,13 @@ class ModusPonens(DeductionRule):
         return expr1 == expr2
     
     def _substitute(self, expr, bindings: dict):
-        """Substitute variables in expression."""
-        if isinstance(expr, Atom):
+        """Substitute variables in expression, sharing subterms the bindings leave unchanged."""
+        if not bindings or expr._free_vars.isdisjoint(bindings):
+            return expr
+        if expr.kind is KIND_ATOM:
             return expr.substitute(bindings)
-        elif isinstance(expr, LogicalExpression):
-            new_operands = [self._substitute(op, bindings) for op in expr.operands]
-            return LogicalExpression(expr.operator, new_operands)
-        return expr
+        new_operands = [self._substitute(op, bindings) for op in expr.operands]
+        return LogicalExpression.intern(expr.operator, new_operands)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -147,37 +492,51 @@ class ModusTollens(DeductionRule):
         Infer: ¬(Pedro)IsA(estudiante)
     """
     
+    premise_kinds = (LogicalOperator.IMPLIES, LogicalOperator.NOT)
+    
     def __init__(self):
         super().__init__("Modus Tollens", priority=9)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Modus Tollens rule."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
-        # Find all implications
-        implications = [item for item in knowledge_base 
-                       if isinstance(item, LogicalExpression) and 
-                       item.operator == LogicalOperator.IMPLIES]
-        
-        # Find all negations
-        negations = [item for item in knowledge_base 
-                    if isinstance(item, LogicalExpression) and 
-                    item.operator == LogicalOperator.NOT]
+        # Pair implications with negations
+        groups = semi_naive_groups(kb_index, delta_index,
+                                   LogicalOperator.IMPLIES, LogicalOperator.NOT)
         
-        for impl in implications:
-            antecedent = impl.operands[0]
-            consequent = impl.operands[1]
+        for implications, negations in groups:
+            if not implications or not negations:
+                continue
             
-            for neg in negations:
-                negated_expr = neg.operands[0]
+            # Index negations by what they negate: atoms go through the
+            # (relation, arity) buckets, compound expressions by equality
+            negation_of = {neg.operands[0]: neg for neg in negations}
+            buckets = AtomIndex(expr for expr in negation_of
+                                 if expr.kind is KIND_ATOM)
+            
+            for impl in implications:
+                antecedent = impl.operands[0]
+                consequent = impl.operands[1]
+                
+                if consequent.kind is KIND_ATOM:
+                    candidates = [negation_of[expr]
+                                  for expr in buckets.candidates(consequent)
+                                  if self._match(consequent, expr)]
+                else:
+                    neg = negation_of.get(consequent)
+                    candidates = [neg] if neg is not None else []
                 
-                # Check if negated expression matches consequent
-                if self._match(consequent, negated_expr):
+                for neg in candidates:
                     # Create negation of antecedent
-                    new_fact = LogicalExpression(LogicalOperator.NOT, [antecedent])
+                    new_fact = LogicalExpression.intern(LogicalOperator.NOT, [antecedent])
                     
                     if new_fact not in knowledge_base and new_fact not in new_facts:
-                        justification = f"Modus Tollens: {neg} ∧ ({impl}) ⊢ {new_fact}"
+                        justification = Justification("Modus Tollens: {} ∧ ({}) ⊢ {}", neg, impl, new_fact)
                         derived.append((new_fact, justification))
                         new_facts.add(new_fact)
         
@@ -185,9 +544,8 @@ class ModusTollens(DeductionRule):
     
     def _match(self, expr1, expr2) -> bool:
         """Check if two expressions match."""
-        if isinstance(expr1, Atom) and isinstance(expr2, Atom):
-            matches, _ = expr1.matches(expr2)
-            return matches
+        if expr1.kind is KIND_ATOM and expr2.kind is KIND_ATOM:
+            return expr1.unifier(expr2) is not None
         return expr1 == expr2
 
 
@@ -205,32 +563,44 @@ class HypotheticalSyllogism(DeductionRule):
         Infer: (X)IsA(estudiante) → (X)aprende
     """
     
+    premise_kinds = (LogicalOperator.IMPLIES,)
+    
     def __init__(self):
         super().__init__("Hypothetical Syllogism", priority=7)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Hypothetical Syllogism."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
-        implications = [item for item in knowledge_base 
-                       if isinstance(item, LogicalExpression) and 
-                       item.operator == LogicalOperator.IMPLIES]
+        groups = semi_naive_groups(kb_index, delta_index,
+                                   LogicalOperator.IMPLIES, LogicalOperator.IMPLIES)
         
-        for impl1 in implications:
-            for impl2 in implications:
-                if impl1 == impl2:
-                    continue
-                
-                # Check if consequent of impl1 matches antecedent of impl2
-                if impl1.operands[1] == impl2.operands[0]:
+        for firsts, seconds in groups:
+            if not firsts or not seconds:
+                continue
+            
+            # Hash join: consequent of impl1 against antecedent of impl2
+            by_antecedent = {}
+            for impl in seconds:
+                by_antecedent.setdefault(impl.operands[0], []).append(impl)
+            
+            for impl1 in firsts:
+                for impl2 in by_antecedent.get(impl1.operands[1], ()):
+                    if impl1 == impl2:
+                        continue
+                    
                     # Create A → C
-                    new_fact = LogicalExpression(
+                    new_fact = LogicalExpression.intern(
                         LogicalOperator.IMPLIES,
                         [impl1.operands[0], impl2.operands[1]]
                     )
                     
                     if new_fact not in knowledge_base and new_fact not in new_facts:
-                        justification = f"Hypothetical Syllogism: ({impl1}) ∧ ({impl2}) ⊢ {new_fact}"
+                        justification = Justification("Hypothetical Syllogism: ({}) ∧ ({}) ⊢ {}", impl1, impl2, new_fact)
                         derived.append((new_fact, justification))
                         new_facts.add(new_fact)
         
@@ -251,37 +621,44 @@ class DisjunctiveSyllogism(DeductionRule):
         Infer: (Pedro)Triste
     """
     
+    premise_kinds = (LogicalOperator.OR, LogicalOperator.NOT)
+    
     def __init__(self):
         super().__init__("Disjunctive Syllogism", priority=8)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Disjunctive Syllogism."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
-        # Find all disjunctions
-        disjunctions = [item for item in knowledge_base 
-                       if isinstance(item, LogicalExpression) and 
-                       item.operator == LogicalOperator.OR]
-        
-        # Find all negations
-        negations = [item for item in knowledge_base 
-                    if isinstance(item, LogicalExpression) and 
-                    item.operator == LogicalOperator.NOT]
-        
-        for disj in disjunctions:
-            for neg in negations:
-                negated_expr = neg.operands[0]
-                
-                # Check if negated expression is in disjunction
+        # Pair disjunctions with negations
+        groups = semi_naive_groups(kb_index, delta_index,
+                                   LogicalOperator.OR, LogicalOperator.NOT)
+        
+        for disjunctions, negations in groups:
+            if not disjunctions or not negations:
+                continue
+            
+            # Join on the negated expression: each disjunct is looked up
+            # instead of compared against every negation
+            negation_of = {neg.operands[0]: neg for neg in negations}
+            
+            for disj in disjunctions:
                 for i, operand in enumerate(disj.operands):
-                    if operand == negated_expr:
-                        # Infer the other disjuncts
-                        for j, other in enumerate(disj.operands):
-                            if i != j:
-                                if other not in knowledge_base and other not in new_facts:
-                                    justification = f"Disjunctive Syllogism: ({disj}) ∧ {neg} ⊢ {other}"
-                                    derived.append((other, justification))
-                                    new_facts.add(other)
+                    neg = negation_of.get(operand)
+                    if neg is None:
+                        continue
+                    
+                    # Infer the other disjuncts
+                    for j, other in enumerate(disj.operands):
+                        if i != j:
+                            if other not in knowledge_base and other not in new_facts:
+                                justification = Justification("Disjunctive Syllogism: ({}) ∧ {} ⊢ {}", disj, neg, other)
+                                derived.append((other, justification))
+                                new_facts.add(other)
         
         return derived
 
@@ -300,24 +677,33 @@ class Simplification(DeductionRule):
         Infer: (Pedro)ViveEn(Madrid)
     """
     
+    premise_kinds = (LogicalOperator.AND,)
+    
     def __init__(self):
         super().__init__("Simplification", priority=10)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Simplification."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
-        # Find all conjunctions
-        conjunctions = [item for item in knowledge_base 
-                       if isinstance(item, LogicalExpression) and 
-                       item.operator == LogicalOperator.AND]
+        # Find all conjunctions (only new ones on an incremental pass)
+        conjunctions = (delta_index or kb_index)[LogicalOperator.AND]
         
+        # Conjunctions already split; their operands are in the knowledge base
+        expanded = set() if seen is None else seen
         for conj in conjunctions:
+            if conj in expanded:
+                continue
             for operand in conj.operands:
                 if operand not in knowledge_base and operand not in new_facts:
-                    justification = f"Simplification: ({conj}) ⊢ {operand}"
+                    justification = Justification("Simplification: ({}) ⊢ {}", conj, operand)
                     derived.append((operand, justification))
                     new_facts.add(operand)
+            expanded.add(conj)
         
         return derived
 
@@ -336,29 +722,48 @@ class Conjunction(DeductionRule):
         Infer: (Pedro)IsA(estudiante) ∧ (Pedro)ViveEn(Madrid)
     """
     
-    def __init__(self):
+    premise_kinds = (KIND_ATOM,)
+    
+    def __init__(self, max_facts: int = CONJUNCTION_MAX_FACTS):
+        """
+        Args:
+            max_facts: Skip the rule when the knowledge base holds more atoms
+        """
         super().__init__("Conjunction", priority=3)
+        self.max_facts = max_facts
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Conjunction."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
         # Get all atomic facts
-        facts = [item for item in knowledge_base if isinstance(item, Atom)]
+        facts = kb_index[KB_ATOMS]
         
         # Limit to avoid combinatorial explosion
-        if len(facts) > 20:
+        if len(facts) > self.max_facts:
             return derived
         
-        # Create conjunctions of pairs
-        for i, fact1 in enumerate(facts):
-            for fact2 in facts[i+1:]:
-                new_fact = LogicalExpression(LogicalOperator.AND, [fact1, fact2])
-                
-                if new_fact not in knowledge_base and new_fact not in new_facts:
-                    justification = f"Conjunction: {fact1} ∧ {fact2} ⊢ {new_fact}"
-                    derived.append((new_fact, justification))
-                    new_facts.add(new_fact)
+        # Create conjunctions of pairs; an incremental pass only needs the
+        # pairs that include a new atom
+        if delta_index is None:
+            pairs = combinations(facts, 2)
+        else:
+            delta = delta_index[KB_ALL]
+            new_atoms = delta_index[KB_ATOMS]
+            old_atoms = [fact for fact in facts if fact not in delta]
+            pairs = chain(combinations(new_atoms, 2), product(new_atoms, old_atoms))
+        
+        for fact1, fact2 in pairs:
+            new_fact = LogicalExpression.intern(LogicalOperator.AND, [fact1, fact2])
+            
+            if new_fact not in knowledge_base and new_fact not in new_facts:
+                justification = Justification("Conjunction: {} ∧ {} ⊢ {}", fact1, fact2, new_fact)
+                derived.append((new_fact, justification))
+                new_facts.add(new_fact)
         
         return derived
 
@@ -374,10 +779,13 @@ class Addition(DeductionRule):
     Note: This rule is disabled by default as it creates infinite possibilities.
     """
     
+    premise_kinds = ()
+    
     def __init__(self):
         super().__init__("Addition", priority=1)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Addition (disabled to avoid explosion)."""
         # This rule is typically not applied automatically
         # as it generates infinite disjunctions
@@ -395,55 +803,102 @@ class Resolution(DeductionRule):
     This is the fundamental rule used in automated theorem proving.
     """
     
+    premise_kinds = (LogicalOperator.OR,)
+    
     def __init__(self):
         super().__init__("Resolution", priority=6)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Resolution."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
         # Find all disjunctions
-        disjunctions = [item for item in knowledge_base 
-                       if isinstance(item, LogicalExpression) and 
-                       item.operator == LogicalOperator.OR]
-        
-        for disj1 in disjunctions:
-            for disj2 in disjunctions:
-                if disj1 == disj2:
-                    continue
-                
-                # Look for complementary literals
+        disjunctions = kb_index[LogicalOperator.OR]
+        
+        if len(disjunctions) < 2:
+            return derived
+        
+        groups = semi_naive_groups(kb_index, delta_index,
+                                   LogicalOperator.OR, LogicalOperator.OR)
+        
+        # Literal sets of resolvents already produced (or found known)
+        seen_clauses = set() if seen is None else seen
+        for clauses, partner_clauses in groups:
+            if not clauses or not partner_clauses:
+                continue
+            containing, negating = self._index_literals(partner_clauses)
+            
+            for disj1 in clauses:
                 for op1 in disj1.operands:
-                    for op2 in disj2.operands:
-                        # Check if op1 is ¬op2 or op2 is ¬op1
-                        if self._are_complementary(op1, op2):
-                            # Create resolvent
-                            remaining1 = [op for op in disj1.operands if op != op1]
-                            remaining2 = [op for op in disj2.operands if op != op2]
-                            
-                            if not remaining1 and not remaining2:
-                                # Empty clause - contradiction
-                                continue
-                            
-                            all_remaining = remaining1 + remaining2
-                            
-                            if len(all_remaining) == 1:
-                                new_fact = all_remaining[0]
-                            else:
-                                new_fact = LogicalExpression(LogicalOperator.OR, all_remaining)
-                            
-                            if new_fact not in knowledge_base and new_fact not in new_facts:
-                                justification = f"Resolution: ({disj1}) ∧ ({disj2}) ⊢ {new_fact}"
-                                derived.append((new_fact, justification))
-                                new_facts.add(new_fact)
+                    # Same complementarity test as _are_complementary(op1, op2)
+                    if op1.kind is LogicalOperator.NOT:
+                        op2 = op1.operands[0]
+                        partners = ((clause, op2) for clause in containing.get(op2, ()))
+                    else:
+                        partners = negating.get(op1, ())
+                
+                    for disj2, op2 in partners:
+                        if disj1 == disj2:
+                            continue
+                    
+                        # Create resolvent as a set of literals, so clauses that
+                        # differ only in order or repeated literals coincide
+                        literals = frozenset(op for op in disj1.operands if op != op1)
+                        literals |= frozenset(op for op in disj2.operands if op != op2)
+                    
+                        if not literals:
+                            # Empty clause - contradiction
+                            continue
+                        if literals in seen_clauses:
+                            continue
+                        seen_clauses.add(literals)
+                        if self._is_tautology(literals):
+                            continue
+                    
+                        if len(literals) == 1:
+                            new_fact = next(iter(literals))
+                        else:
+                            new_fact = LogicalExpression.intern(LogicalOperator.OR, literals)
+                    
+                        if new_fact not in knowledge_base and new_fact not in new_facts:
+                            justification = Justification("Resolution: ({}) ∧ ({}) ⊢ {}", disj1, disj2, new_fact)
+                            derived.append((new_fact, justification))
+                            new_facts.add(new_fact)
+        
         
         return derived
     
+    def _index_literals(self, clauses: List) -> Tuple[Dict, Dict]:
+        """
+        Index clause literals for complementary lookups.
+        
+        Returns:
+            Tuple of (clauses by each operand they contain, (clause, ¬A) pairs
+            by the literal A they negate)
+        """
+        containing = defaultdict(list)
+        negating = defaultdict(list)
+        for clause in clauses:
+            for operand in clause.operands:
+                containing[operand].append(clause)
+                if operand.kind is LogicalOperator.NOT:
+                    negating[operand.operands[0]].append((clause, operand))
+        return containing, negating
+    
+    def _is_tautology(self, literals: frozenset) -> bool:
+        """Check if a clause contains some literal together with its negation."""
+        return any(literal.kind is LogicalOperator.NOT and literal.operands[0] in literals
+                   for literal in literals)
+    
     def _are_complementary(self, expr1, expr2) -> bool:
         """Check if two expressions are complementary (one is negation of other)."""
-        if isinstance(expr1, LogicalExpression) and expr1.operator == LogicalOperator.NOT:
+        if expr1.kind is LogicalOperator.NOT:
             return expr1.operands[0] == expr2
-        if isinstance(expr2, LogicalExpression) and expr2.operator == LogicalOperator.NOT:
+        if expr2.kind is LogicalOperator.NOT:
             return expr2.operands[0] == expr1
         return False
 
@@ -462,39 +917,102 @@ class BiconditionalElimination(DeductionRule):
         Infer: (X)TienePelo → (X)EsMamifero
     """
     
+    premise_kinds = (LogicalOperator.IFF,)
+    
     def __init__(self):
         super().__init__("Biconditional Elimination", priority=9)
     
-    def apply(self, knowledge_base: Set, new_facts: Set) -> List[Tuple]:
+    def apply(self, kb_index: Dict, new_facts: Set, delta_index: Optional[Dict] = None,
+              seen: Optional[Set] = None) -> List[Tuple]:
         """Apply Biconditional Elimination."""
+        kb_index = ensure_kb_index(kb_index)
+        delta_index = ensure_kb_index(delta_index)
+        knowledge_base = kb_index[KB_ALL]
         derived = []
         
         # Find all biconditionals
-        biconditionals = [item for item in knowledge_base 
-                         if isinstance(item, LogicalExpression) and 
-                         item.operator == LogicalOperator.IFF]
+        biconditionals = (delta_index or kb_index)[LogicalOperator.IFF]
         
+        # Biconditionals already eliminated; both implications are known
+        expanded = set() if seen is None else seen
         for iff in biconditionals:
+            if iff in expanded:
+                continue
+            expanded.add(iff)
             left = iff.operands[0]
             right = iff.operands[1]
             
             # Create A → B
-            impl1 = LogicalExpression(LogicalOperator.IMPLIES, [left, right])
+            impl1 = LogicalExpression.intern(LogicalOperator.IMPLIES, [left, right])
             if impl1 not in knowledge_base and impl1 not in new_facts:
-                justification = f"Biconditional Elimination: ({iff}) ⊢ {impl1}"
+                justification = Justification("Biconditional Elimination: ({}) ⊢ {}", iff, impl1)
                 derived.append((impl1, justification))
                 new_facts.add(impl1)
             
             # Create B → A
-            impl2 = LogicalExpression(LogicalOperator.IMPLIES, [right, left])
+            impl2 = LogicalExpression.intern(LogicalOperator.IMPLIES, [right, left])
             if impl2 not in knowledge_base and impl2 not in new_facts:
-                justification = f"Biconditional Elimination: ({iff}) ⊢ {impl2}"
+                justification = Justification("Biconditional Elimination: ({}) ⊢ {}", iff, impl2)
                 derived.append((impl2, justification))
                 new_facts.add(impl2)
         
         return derived
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# RULE NETWORK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class RuleNetwork:
+    """
+    Alpha network routing new facts to the rules they can trigger.
+    
+    Built once from each rule's premise_kinds. On an incremental pass only
+    rules with a premise kind present among the new facts are activated:
+    every other rule would only rederive what the previous pass found. The
+    joins between premises (beta nodes) are the hash lookups inside each
+    rule.
+    """
+    
+    def __init__(self, rules: List[DeductionRule]):
+        """
+        Args:
+            rules: Rules in application order
+        """
+        self.rules = list(rules)
+        self.wildcard = [rule for rule in self.rules if rule.premise_kinds is None]
+        self.by_kind = defaultdict(list)
+        for rule in self.rules:
+            for kind in rule.premise_kinds or ():
+                self.by_kind[kind].append(rule)
+    
+    def activate(self, delta_index: Optional[Dict],
+                 kb_index: Optional[Dict] = None) -> List[DeductionRule]:
+        """
+        Rules to apply for a pass, in application order.
+        
+        Args:
+            delta_index: Index of the facts added by the previous pass, or
+                None for a full pass (every rule is activated)
+            kb_index: Index of the whole knowledge base, which lets rules
+                without fixed premise kinds narrow down their triggers
+        """
+        if delta_index is None:
+            return self.rules
+        if not delta_index[KB_ALL]:
+            return []
+        
+        active = set()
+        for rule in self.wildcard:
+            kinds = None if kb_index is None else rule.trigger_kinds(kb_index)
+            if kinds is None or any(delta_index.get(kind) for kind in kinds):
+                active.add(rule)
+        for kind, rules in self.by_kind.items():
+            if delta_index.get(kind):
+                active.update(rules)
+        return [rule for rule in self.rules if rule in active]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # RULE MANAGER
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -502,12 +1020,17 @@ class BiconditionalElimination(DeductionRule):
 class RuleManager:
     """Manages and applies all deduction rules."""
     
-    def __init__(self, enable_conjunction: bool = False):
+    def __init__(self, enable_conjunction: bool = False,
+                 conjunction_max_facts: int = CONJUNCTION_MAX_FACTS,
+                 max_workers: int = 1):
         """
         Initialize the rule manager.
         
         Args:
             enable_conjunction: Whether to enable conjunction rule (can be expensive)
+            conjunction_max_facts: Atom count above which Conjunction is skipped
+            max_workers: Threads used to apply the rules of a pass concurrently;
+                1 applies them one after another
         """
         self.rules = [
             ModusPonens(),
@@ -520,30 +1043,152 @@ class RuleManager:
         ]
         
         if enable_conjunction:
-            self.rules.append(Conjunction())
+            self.rules.append(Conjunction(max_facts=conjunction_max_facts))
         
         # Sort by priority (highest first)
         self.rules.sort(key=lambda r: r.priority, reverse=True)
+        self.network = RuleNetwork(self.rules)
+        self.max_workers = max_workers
+        
+        # State carried between incremental calls: the index of their
+        # knowledge base, the signature of the premise buckets each rule last
+        # ran on, and the set each rule records its fully used premises in
+        self._kb_index = None
+        self._signatures = {}
+        self._seen = {rule: set() for rule in self.rules}
     
-    def apply_all_rules(self, knowledge_base: Set) -> List[Tuple]:
+    def apply_all_rules(self, knowledge_base: Set, delta: Optional[Set] = None,
+                        new_facts: Optional[Set] = None,
+                        incremental: bool = False) -> List[Tuple]:
         """
         Apply all rules to the knowledge base.
         
+        The knowledge base is indexed by operator and the index is shared
+        by every rule. With a delta, only the rules the rule network
+        activates for it are applied.
+        
         Args:
-            knowledge_base: Set of known facts and rules
+            knowledge_base: Set of known facts and rules, or an IndexedKB
+                over them (used as the index directly)
+            delta: Facts added to knowledge_base by the previous round. When
+                given, evaluation is semi-naive: rules only try derivations
+                that use at least one of them, since everything else was
+                already derived last round.
+            new_facts: Empty set that collects the derived facts, so callers
+                can add them to the knowledge base in one update (or use
+                them as the next delta) without rebuilding the set
+            incremental: Carry rule state over from the previous incremental
+                call on the same knowledge base: its index is extended with
+                the delta instead of being rebuilt, rules whose premise
+                buckets are unchanged since they last ran are skipped, and
+                premises a rule fully used are not tried again. Only valid
+                when every derived fact is added to the knowledge base
+                between calls, as LogicEngine.infer_all does. By default
+                each call derives as if the rules had never run.
         
         Returns:
             List of tuples: (new_fact, justification)
         """
-        new_facts = set()
-        all_derived = []
+        if incremental:
+            kb_index = self._index_knowledge_base(knowledge_base, delta)
+        elif isinstance(knowledge_base, IndexedKB):
+            kb_index = knowledge_base
+            kb_index.sync(delta)
+        else:
+            kb_index = IndexedKB(ensure_set(knowledge_base))
+        delta_index = None if delta is None else build_kb_index(delta)
+        if new_facts is None:
+            new_facts = set()
+        rules = self.network.activate(delta_index, kb_index)
+        if incremental:
+            rules = [rule for rule in rules if self._inputs_changed(rule, kb_index)]
+            seen = self._seen
+        else:
+            seen = {}
         
-        for rule in self.rules:
-            derived = rule.apply(knowledge_base, new_facts)
+        if self.max_workers > 1 and len(rules) > 1:
+            return self._apply_concurrently(rules, kb_index, delta_index, new_facts, seen)
+        
+        all_derived = []
+        for rule in rules:
+            derived = rule.apply(kb_index, new_facts, delta_index, seen.get(rule))
             all_derived.extend(derived)
         
         return all_derived
     
+    def _inputs_changed(self, rule: DeductionRule, kb_index: IndexedKB) -> bool:
+        """
+        Check whether rule's premise buckets changed since it last ran.
+        
+        Its previous derivations were added to the knowledge base, so on
+        unchanged premises it cannot derive anything new and is skipped.
+        """
+        signature = kb_index.signature(rule.premise_kinds)
+        if self._signatures.get(rule) == signature:
+            return False
+        self._signatures[rule] = signature
+        return True
+    
+    def _apply_concurrently(self, rules: List[DeductionRule], kb_index: Dict,
+                            delta_index: Optional[Dict], new_facts: Set,
+                            seen: Dict) -> List[Tuple]:
+        """
+        Apply rules on worker threads, then merge their derivations in rule order.
+        
+        Rules only read the shared indexes, so each gets a private new_facts
+        set; merging in priority order keeps the derivation a serial pass
+        would have recorded for facts several rules derive.
+        """
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(rules))) as executor:
+            results = list(executor.map(
+                lambda rule: rule.apply(kb_index, set(), delta_index, seen.get(rule)),
+                rules))
+        
+        all_derived = []
+        for derived in results:
+            for fact, justification in derived:
+                if fact not in new_facts:
+                    new_facts.add(fact)
+                    all_derived.append((fact, justification))
+        return all_derived
+    
+    def _index_knowledge_base(self, knowledge_base: Union[Set, IndexedKB],
+                              delta: Optional[Set]) -> IndexedKB:
+        """
+        Index knowledge_base for an incremental call, reusing the previous index.
+        
+        The previous index is kept while calls pass the same set, and only
+        indexes the facts added since (normally the delta), so each round
+        only indexes what it added. A different set or index starts a new
+        knowledge base, so the rule state kept for the old one is reset.
+        """
+        if isinstance(knowledge_base, IndexedKB):
+            if knowledge_base is not self._kb_index:
+                self.reset()
+                self._kb_index = knowledge_base
+            knowledge_base.sync(delta)
+            return knowledge_base
+        
+        kb_index = self._kb_index
+        if kb_index is None or kb_index[KB_ALL] is not knowledge_base:
+            self.reset()
+            kb_index = self._kb_index = IndexedKB(ensure_set(knowledge_base))
+        else:
+            kb_index.sync(delta)
+        return kb_index
+    
+    def reset(self):
+        """
+        Reset the rule state kept between incremental calls.
+        
+        That state assumes every derived fact is added to a knowledge base
+        that only grows. Call this whenever that knowledge base is cleared.
+        """
+        self._kb_index = None
+        self._signatures.clear()
+        for seen in self._seen.values():
+            seen.clear()
+    
     def get_rule_names(self) -> List[str]:
         """Get names of all active rules."""
         return [rule.name for rule in self.rules]
@@ -555,7 +1200,7 @@ class RuleManager:
 
 if __name__ == "__main__":
     """Test the deduction rules."""
-    from logic_parser import parse_expression
+    from logic_parser import parse_expression  # script mode, see imports above
     
     print("╔══════════════════════════════════════════════════════════════════════════════╗")
     print("║                    DEDUCTION RULES - TEST SUITE                              ║")
@@ -19,48 +19,184 @@ Version: 1.0
 
 import sys
 import os
+import re
+import logging
 
 # Add parent directory to path to import engine
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from typing import Set, List, Tuple, Dict, Optional, Union
-from dataclasses import dataclass, field
-from logic_parser import Atom, LogicalExpression, LogicalOperator, parse_expression
-from deduction_rules import RuleManager
+from typing import Set, FrozenSet, List, Tuple, Dict, Optional, Union, Iterable, TextIO
+from dataclasses import dataclass
+
+try:
+    from .logic_parser import (Atom, LogicalExpression, LogicalOperator,
+                               intern_term, parse_expression)
+    from .deduction_rules import KB_ALL, IndexedKB, Justification, RuleManager
+except ImportError:
+    # Running as a standalone script (python logic_engine.py)
+    from logic_parser import (Atom, LogicalExpression, LogicalOperator,
+                              intern_term, parse_expression)
+    from deduction_rules import KB_ALL, IndexedKB, Justification, RuleManager
+
+
+# Line pattern for .inf files: groups are the line without surrounding
+# whitespace and "# comment", its "Rule:" marker if any, and the expression
+# text. [^\S\n] is any whitespace str.strip() removes, short of a newline.
+# Blank and comment-only lines match with an empty line group.
+_INF_LINE_RE = re.compile(
+    r'^[^\S\n]*(?!#)((?:(Rule:)[^\S\n]*)?([^#\n]*?))[^\S\n]*(?:#.*)?$', re.M)
+
+# Export settings: file buffer size and number of lines written per batch
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_BATCH_LINES = 1000
+
+# Kinds tracked as rules (implications and biconditionals); atoms carry
+# KIND_ATOM, so one set test classifies any term
+_RULE_OPS = frozenset({LogicalOperator.IMPLIES, LogicalOperator.IFF})
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROGRESS OUTPUT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_LOG = logging.getLogger(__name__)
+
+_SEPARATOR = "=" * 70
+_BANNER_INFERENCE = (
+    "╔══════════════════════════════════════════════════════════════════════════════╗\n"
+    "║                    EXHAUSTIVE INFERENCE - FORWARD CHAINING                   ║\n"
+    "╚══════════════════════════════════════════════════════════════════════════════╝\n"
+)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    Handler writing to whatever sys.stdout is when a record is emitted.
+    
+    A plain StreamHandler keeps the stream it was created with, so output
+    would miss a later redirect_stdout() or test capture, as print() does not.
+    """
+    
+    def __init__(self):
+        super().__init__(sys.stdout)
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, stream):
+        # Set by StreamHandler.__init__/setStream; sys.stdout always wins
+        pass
+
+
+def _console_logger(logger: logging.Logger) -> logging.Logger:
+    """
+    Attach a plain stdout handler to a module logger on first use.
+    
+    Applications that configure their own handlers on the logger keep them;
+    the default handler is only added when none is present. Shared with api.
+    
+    Args:
+        logger: Module logger used for verbose progress output
+    
+    Returns:
+        The same logger
+    """
+    if not logger.handlers:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
 class DerivationChain:
-    """Represents a chain of reasoning leading to a conclusion."""
-    conclusion: Union[Atom, LogicalExpression]
-    justification: str
-    depth: int
-    premises: List[Union[Atom, LogicalExpression]] = field(default_factory=list)
+    """
+    Represents a chain of reasoning leading to a conclusion.
+    
+    One is kept per derived fact, so it uses slots instead of an instance
+    dict, and the premises list is only allocated once it is asked for.
+    A Justification from the rules is kept as is and only formatted when
+    the justification text is first read.
+    """
+    
+    __slots__ = ('conclusion', '_justification', 'depth', '_premises')
+    
+    def __init__(self, conclusion: Union[Atom, LogicalExpression],
+                 justification: Union[str, Justification], depth: int,
+                 premises: Optional[List[Union[Atom, LogicalExpression]]] = None):
+        self.conclusion = conclusion
+        self._justification = justification
+        self.depth = depth
+        self._premises = premises
+    
+    @property
+    def justification(self) -> str:
+        return str(self._justification)
+    
+    @justification.setter
+    def justification(self, justification: Union[str, Justification]):
+        self._justification = justification
+    
+    @property
+    def premises(self) -> List[Union[Atom, LogicalExpression]]:
+        if self._premises is None:
+            self._premises = []
+        return self._premises
+    
+    @premises.setter
+    def premises(self, premises: List[Union[Atom, LogicalExpression]]):
+        self._premises = premises
     
     def __str__(self):
         return f"[Depth {self.depth}] {self.conclusion} ← {self.justification}"
+    
+    def __repr__(self):
+        return (f"DerivationChain(conclusion={self.conclusion!r}, "
+                f"justification={self.justification!r}, depth={self.depth!r}, "
+                f"premises={self._premises or []!r})")
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.conclusion, self.justification, self.depth, self._premises or []) ==
+                (other.conclusion, other.justification, other.depth, other._premises or []))
+    
+    # Mutable and compared by value, like the dataclass it replaces
+    __hash__ = None
 
 
 @dataclass
 class InferenceResult:
-    """Complete result of inference process."""
-    original_facts: Set[Union[Atom, LogicalExpression]]
-    original_rules: Set[LogicalExpression]
-    derived_facts: List[DerivationChain]
+    """Complete result of inference process (an immutable snapshot)."""
+    __slots__ = ('original_facts', 'original_rules', 'derived_facts',
+                 'iterations', 'contradictions')
+    
+    original_facts: FrozenSet[Union[Atom, LogicalExpression]]
+    original_rules: FrozenSet[LogicalExpression]
+    derived_facts: Tuple[DerivationChain, ...]
     iterations: int
-    contradictions: List[str]
+    contradictions: Tuple[str, ...]
     
     def get_all_facts(self) -> Set:
         """Get all facts (original + derived)."""
-        all_facts = self.original_facts.copy()
-        for chain in self.derived_facts:
-            all_facts.add(chain.conclusion)
+        all_facts = set(self.original_facts)
+        all_facts.update(chain.conclusion for chain in self.derived_facts)
         return all_facts
     
+    def count_all_facts(self) -> int:
+        """Count all facts (original + derived) without copying them into a new set."""
+        original = self.original_facts
+        derived_only = {chain.conclusion for chain in self.derived_facts
+                        if chain.conclusion not in original}
+        return len(original) + len(derived_only)
+    
     def get_facts_by_depth(self) -> Dict[int, List]:
         """Group derived facts by derivation depth."""
         by_depth = {}
@@ -94,21 +230,35 @@ class LogicEngine:
         >>> print(result.derived_facts)
     """
     
-    def __init__(self, max_iterations: int = 100, enable_conjunction: bool = False):
+    def __init__(self, max_iterations: int = 100, enable_conjunction: bool = False,
+                 parallel: bool = False):
         """
         Initialize the logic engine.
         
         Args:
             max_iterations: Maximum number of inference iterations
             enable_conjunction: Enable conjunction rule (can be expensive)
+            parallel: Apply the rules of each iteration on a thread pool (only
+                pays off on large knowledge bases)
         """
         self.knowledge_base: Set[Union[Atom, LogicalExpression]] = set()
+        self._kb_index = IndexedKB(self.knowledge_base)
         self.original_facts: Set[Union[Atom, LogicalExpression]] = set()
         self.original_rules: Set[LogicalExpression] = set()
         self.derivation_chains: List[DerivationChain] = []
+        # First derivation chain of each conclusion, for get_derivation_chain
+        self._chain_by_conclusion: Dict[Union[Atom, LogicalExpression], DerivationChain] = {}
         self.max_iterations = max_iterations
-        self.rule_manager = RuleManager(enable_conjunction=enable_conjunction)
+        self.rule_manager = RuleManager(
+            enable_conjunction=enable_conjunction,
+            max_workers=(os.cpu_count() or 1) if parallel else 1
+        )
         self.contradictions: List[str] = []
+        
+        # Facts added since inference last reached a fixpoint, and the size the
+        # knowledge base had then; None forces a full first pass
+        self._pending: Optional[Set] = None
+        self._saturated_size = 0
     
     def clear(self):
         """Clear all knowledge from the engine."""
@@ -116,7 +266,31 @@ class LogicEngine:
         self.original_facts.clear()
         self.original_rules.clear()
         self.derivation_chains.clear()
+        self._chain_by_conclusion.clear()
         self.contradictions.clear()
+        self.rule_manager.reset()
+        self._kb_index = IndexedKB(self.knowledge_base)
+        self._pending = None
+        self._saturated_size = 0
+    
+    def _indexed_kb(self) -> IndexedKB:
+        """
+        Index of the knowledge base, rebuilt if the set was replaced.
+        
+        A replaced set is a new knowledge base: rule state and pending facts
+        kept for the old one are dropped, as in clear().
+        """
+        if self._kb_index[KB_ALL] is not self.knowledge_base:
+            self.rule_manager.reset()
+            self._kb_index = IndexedKB(self.knowledge_base)
+            self._pending = None
+        return self._kb_index
+    
+    def _track_new(self, items: Iterable):
+        """Remember items not yet in the knowledge base as pending for infer_all."""
+        if self._pending is not None:
+            knowledge_base = self.knowledge_base
+            self._pending.update(item for item in items if item not in knowledge_base)
     
     def add_fact(self, fact: Union[str, Atom, LogicalExpression]):
         """
@@ -125,10 +299,10 @@ class LogicEngine:
         Args:
             fact: Fact as string or parsed expression
         """
-        if isinstance(fact, str):
-            fact = parse_expression(fact)
+        fact = parse_expression(fact) if isinstance(fact, str) else intern_term(fact)
         
-        self.knowledge_base.add(fact)
+        self._track_new((fact,))
+        self._indexed_kb().add(fact)
         self.original_facts.add(fact)
     
     def add_rule(self, rule: Union[str, LogicalExpression]):
@@ -138,19 +312,69 @@ class LogicEngine:
         Args:
             rule: Rule as string or parsed expression (should be implication)
         """
-        if isinstance(rule, str):
-            rule = parse_expression(rule)
+        rule = parse_expression(rule) if isinstance(rule, str) else intern_term(rule)
         
-        self.knowledge_base.add(rule)
+        self._track_new((rule,))
+        self._indexed_kb().add(rule)
         
         # Track as rule if it's an implication or biconditional
-        if isinstance(rule, LogicalExpression) and rule.operator in [
-            LogicalOperator.IMPLIES, LogicalOperator.IFF
-        ]:
+        if rule.kind in _RULE_OPS:
             self.original_rules.add(rule)
         else:
             self.original_facts.add(rule)
     
+    def add_facts(self, facts: Iterable[Union[str, Atom, LogicalExpression]]):
+        """
+        Add several facts to the knowledge base in a single batch.
+        
+        Args:
+            facts: Facts as strings or parsed expressions
+        """
+        parsed = [parse_expression(fact) if isinstance(fact, str) else intern_term(fact)
+                  for fact in facts]
+        
+        self._bulk_add(parsed, ())
+    
+    def add_rules(self, rules: Iterable[Union[str, LogicalExpression]]):
+        """
+        Add several rules to the knowledge base in a single batch.
+        
+        Args:
+            rules: Rules as strings or parsed expressions
+        """
+        parsed = [parse_expression(rule) if isinstance(rule, str) else intern_term(rule)
+                  for rule in rules]
+        
+        self._bulk_add((), parsed)
+    
+    def _bulk_add(self, facts: List, rules: List):
+        """
+        Insert already parsed facts and rules with one update per set.
+        
+        Args:
+            facts: Parsed facts
+            rules: Parsed rules; those that are not implications or
+                biconditionals are tracked as facts, as in add_rule
+        """
+        items = list(facts)
+        items.extend(rules)
+        if not items:
+            return
+        
+        self._track_new(items)
+        self._indexed_kb().update(items)
+        
+        # Track as rule if it's an implication or biconditional
+        tracked, untracked = [], list(facts)
+        for rule in rules:
+            if rule.kind in _RULE_OPS:
+                tracked.append(rule)
+            else:
+                untracked.append(rule)
+        
+        self.original_facts.update(untracked)
+        self.original_rules.update(tracked)
+    
     def load_from_file(self, filepath: str):
         """
         Load facts and rules from a .inf file.
@@ -160,42 +384,41 @@ class LogicEngine:
         """
         encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
         
+        # Read the bytes once and try each encoding in memory
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = None
+        
         content = None
-        for encoding in encodings:
-            try:
-                with open(filepath, 'r', encoding=encoding) as f:
-                    content = f.read()
-                break
-            except (UnicodeDecodeError, FileNotFoundError):
-                continue
+        if data is not None:
+            for encoding in encodings:
+                try:
+                    content = data.decode(encoding)
+                    break
+                except UnicodeDecodeError:
+                    continue
         
         if content is None:
             raise ValueError(f"Could not read file: {filepath}")
         
-        lines = content.split('\n')
+        # Normalize newlines as text-mode open() would
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
         
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
+        # Lines are parsed in file order (so are any warnings), then
+        # everything is inserted in one batch
+        facts, rules = [], []
+        for line, rule_marker, text in _INF_LINE_RE.findall(content):
+            if not line:
                 continue
-            
-            # Remove inline comments
-            if '#' in line:
-                line = line.split('#')[0].strip()
-            
             try:
-                # Check if it's a rule (starts with "Rule:")
-                if line.startswith('Rule:'):
-                    rule_text = line[5:].strip()
-                    self.add_rule(rule_text)
-                else:
-                    # It's a fact
-                    self.add_fact(line)
+                (rules if rule_marker else facts).append(parse_expression(text))
             except Exception as e:
-                print(f"Warning: Could not parse line: {line}")
+                print(f"Warning: Could not parse line: {line.rstrip()}")
                 print(f"  Error: {e}")
+        
+        self._bulk_add(facts, rules)
     
     def infer_all(self, verbose: bool = False) -> InferenceResult:
         """
@@ -206,94 +429,112 @@ class LogicEngine:
         2. Add newly derived facts to knowledge base
         3. Repeat until no new facts are derived or max iterations reached
         
+        After the first pass, evaluation is semi-naive: each iteration only
+        tries derivations that use a fact added by the previous one. When an
+        earlier run reached a fixpoint, the first pass is semi-naive too,
+        seeded with the facts and rules added since.
+        
         Args:
-            verbose: If True, print progress information
+            verbose: If True, print progress information (one write per
+                iteration, through the module logger)
         
         Returns:
             InferenceResult containing all derived facts and metadata
         """
         if verbose:
-            print("╔══════════════════════════════════════════════════════════════════════════════╗")
-            print("║                    EXHAUSTIVE INFERENCE - FORWARD CHAINING                   ║")
-            print("╚══════════════════════════════════════════════════════════════════════════════╝\n")
-            print(f"Initial facts: {len(self.original_facts)}")
-            print(f"Initial rules: {len(self.original_rules)}")
-            print(f"Active inference rules: {', '.join(self.rule_manager.get_rule_names())}")
-            print("\n" + "=" * 70)
+            log = _console_logger(_LOG)
+            log.info(_BANNER_INFERENCE)
+            log.info("Initial facts: %d\nInitial rules: %d\nActive inference rules: %s\n\n%s",
+                     len(self.original_facts), len(self.original_rules),
+                     ', '.join(self.rule_manager.get_rule_names()), _SEPARATOR)
         
         iteration = 0
         total_derived = 0
         
+        # Bind hot-loop lookups once; the fixpoint body runs per iteration
+        apply_all_rules = self.rule_manager.apply_all_rules
+        kb_index = self._indexed_kb()
+        kb_update = kb_index.update
+        add_chains = self.derivation_chains.extend
+        index_chains = self._chain_by_conclusion.update
+        
+        # Facts added by the previous iteration; None forces a full first pass
+        delta = None
+        pending = self._pending
+        if (pending is not None and
+                len(self.knowledge_base) == self._saturated_size + len(pending)):
+            delta = pending
+        self._pending = None
+        saturated = False
+        
         while iteration < self.max_iterations:
             iteration += 1
             
             if verbose:
-                print(f"\nIteration {iteration}:")
-                print(f"  Knowledge base size: {len(self.knowledge_base)}")
+                kb_size = len(self.knowledge_base)
             
             # Apply all inference rules
-            derived = self.rule_manager.apply_all_rules(self.knowledge_base)
+            new_facts = set()
+            derived = apply_all_rules(kb_index, delta, new_facts, incremental=True)
             
             if not derived:
                 if verbose:
-                    print(f"  No new facts derived. Inference complete.")
+                    log.info("\nIteration %d:\n  Knowledge base size: %d\n"
+                             "  No new facts derived. Inference complete.", iteration, kb_size)
+                saturated = True
                 break
             
-            # Add derived facts to knowledge base and track derivations
-            for fact, justification in derived:
-                self.knowledge_base.add(fact)
-                chain = DerivationChain(
-                    conclusion=fact,
-                    justification=justification,
-                    depth=iteration
-                )
-                self.derivation_chains.append(chain)
-                total_derived += 1
-                
-                if verbose:
-                    print(f"  ✓ {fact}")
+            # Add derived facts to knowledge base and track derivations; every
+            # derived fact is new, so each chain is the first for its conclusion
+            kb_update(new_facts)
+            chains = [DerivationChain(fact, justification, iteration)
+                      for fact, justification in derived]
+            add_chains(chains)
+            index_chains((chain.conclusion, chain) for chain in chains)
+            total_derived += len(derived)
+            delta = new_facts
             
             if verbose:
-                print(f"  Derived {len(derived)} new facts in this iteration")
+                lines = [f"\nIteration {iteration}:", f"  Knowledge base size: {kb_size}"]
+                lines.extend(f"  ✓ {fact}" for fact, _ in derived)
+                lines.append(f"  Derived {len(derived)} new facts in this iteration")
+                log.info("\n".join(lines))
+        
+        if saturated:
+            self._pending = set()
+            self._saturated_size = len(self.knowledge_base)
         
         # Check for contradictions
         self._detect_contradictions()
         
         if verbose:
-            print("\n" + "=" * 70)
-            print(f"\nInference complete after {iteration} iterations")
-            print(f"Total facts derived: {total_derived}")
-            print(f"Final knowledge base size: {len(self.knowledge_base)}")
+            lines = ["\n" + _SEPARATOR,
+                     f"\nInference complete after {iteration} iterations",
+                     f"Total facts derived: {total_derived}",
+                     f"Final knowledge base size: {len(self.knowledge_base)}"]
             
             if self.contradictions:
-                print(f"\n⚠️  Contradictions detected: {len(self.contradictions)}")
-                for contradiction in self.contradictions:
-                    print(f"  • {contradiction}")
+                lines.append(f"\n⚠️  Contradictions detected: {len(self.contradictions)}")
+                lines.extend(f"  • {contradiction}" for contradiction in self.contradictions)
+            log.info("\n".join(lines))
         
         return InferenceResult(
-            original_facts=self.original_facts.copy(),
-            original_rules=self.original_rules.copy(),
-            derived_facts=self.derivation_chains.copy(),
+            original_facts=frozenset(self.original_facts),
+            original_rules=frozenset(self.original_rules),
+            derived_facts=tuple(self.derivation_chains),
             iterations=iteration,
-            contradictions=self.contradictions.copy()
+            contradictions=tuple(self.contradictions)
         )
     
     def _detect_contradictions(self):
         """Detect logical contradictions in the knowledge base."""
         self.contradictions.clear()
         
-        # Look for P and ¬P
-        atoms = {item for item in self.knowledge_base if isinstance(item, Atom)}
-        negations = {item for item in self.knowledge_base 
-                    if isinstance(item, LogicalExpression) and 
-                    item.operator == LogicalOperator.NOT}
-        
-        for neg in negations:
-            negated_expr = neg.operands[0]
-            if negated_expr in atoms:
-                self.contradictions.append(
-                    f"Contradiction: {negated_expr} and {neg} both present"
-                )
+        # P/¬P pairs are recorded by the index as facts are added
+        for negated_expr, neg in self._indexed_kb().contradictions:
+            self.contradictions.append(
+                f"Contradiction: {negated_expr} and {neg} both present"
+            )
     
     def query(self, query: Union[str, Atom, LogicalExpression]) -> bool:
         """
@@ -310,6 +551,20 @@ class LogicEngine:
         
         return query in self.knowledge_base
     
+    def query_many(self, queries: Iterable[Union[str, Atom, LogicalExpression]]) -> List[bool]:
+        """
+        Query several facts at once (see query()).
+        
+        Args:
+            queries: Facts to check
+        
+        Returns:
+            One bool per query, in order
+        """
+        contains = self.knowledge_base.__contains__
+        return [contains(parse_expression(query) if isinstance(query, str) else query)
+                for query in queries]
+    
     def get_derivation_chain(self, fact: Union[str, Atom, LogicalExpression]) -> Optional[DerivationChain]:
         """
         Get the derivation chain for a specific fact.
@@ -323,76 +578,95 @@ class LogicEngine:
         if isinstance(fact, str):
             fact = parse_expression(fact)
         
-        for chain in self.derivation_chains:
-            if chain.conclusion == fact:
-                return chain
+        if len(self._chain_by_conclusion) != len(self.derivation_chains):
+            # Chains were added outside infer_all; index them again
+            self._chain_by_conclusion.clear()
+            for chain in self.derivation_chains:
+                self._chain_by_conclusion.setdefault(chain.conclusion, chain)
         
-        return None
+        return self._chain_by_conclusion.get(fact)
     
-    def export_results(self, filepath: str, result: InferenceResult):
+    def export_results(self, filepath: Union[str, TextIO], result: InferenceResult):
         """
         Export inference results to a file.
         
         Args:
-            filepath: Path to output file
+            filepath: Path to output file, or an already open text stream
             result: InferenceResult to export
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("╔══════════════════════════════════════════════════════════════════════════════╗\n")
-            f.write("║                    INFERENCE RESULTS - LOGIC ENGINE                          ║\n")
-            f.write("╚══════════════════════════════════════════════════════════════════════════════╝\n\n")
-            
-            # Original facts
-            f.write("═" * 70 + "\n")
-            f.write("ORIGINAL FACTS\n")
-            f.write("═" * 70 + "\n")
-            for fact in sorted(result.original_facts, key=str):
-                if fact not in result.original_rules:
-                    f.write(f"{fact}\n")
-            f.write("\n")
-            
-            # Original rules
-            f.write("═" * 70 + "\n")
-            f.write("ORIGINAL RULES\n")
-            f.write("═" * 70 + "\n")
-            for rule in sorted(result.original_rules, key=str):
-                f.write(f"{rule}\n")
-            f.write("\n")
-            
-            # Derived facts by depth
-            f.write("═" * 70 + "\n")
-            f.write("DERIVED FACTS (BY INFERENCE DEPTH)\n")
-            f.write("═" * 70 + "\n")
-            
-            by_depth = result.get_facts_by_depth()
-            for depth in sorted(by_depth.keys()):
-                f.write(f"\n--- Depth {depth} ---\n")
-                for chain in by_depth[depth]:
-                    f.write(f"{chain.conclusion}\n")
-                    f.write(f"  ← {chain.justification}\n")
-            
+        if isinstance(filepath, str):
+            with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                self._write_results(f, result)
+        else:
+            self._write_results(filepath, result)
+    
+    def _write_results(self, f: TextIO, result: InferenceResult):
+        """Write inference results to an open stream, one batch of lines at a time."""
+        f.write("╔══════════════════════════════════════════════════════════════════════════════╗\n")
+        f.write("║                    INFERENCE RESULTS - LOGIC ENGINE                          ║\n")
+        f.write("╚══════════════════════════════════════════════════════════════════════════════╝\n\n")
+        
+        # Original facts
+        f.write("═" * 70 + "\n")
+        f.write("ORIGINAL FACTS\n")
+        f.write("═" * 70 + "\n")
+        # Filter before sorting; str() of a term is cached, so it is the sort key
+        plain_facts = [fact for fact in result.original_facts
+                       if fact not in result.original_rules]
+        _write_batched(f, (f"{fact}\n" for fact in sorted(plain_facts, key=str)))
+        f.write("\n")
+        
+        # Original rules
+        f.write("═" * 70 + "\n")
+        f.write("ORIGINAL RULES\n")
+        f.write("═" * 70 + "\n")
+        _write_batched(f, (f"{rule}\n" for rule in sorted(result.original_rules, key=str)))
+        f.write("\n")
+        
+        # Derived facts by depth
+        f.write("═" * 70 + "\n")
+        f.write("DERIVED FACTS (BY INFERENCE DEPTH)\n")
+        f.write("═" * 70 + "\n")
+        
+        by_depth = result.get_facts_by_depth()
+        for depth in sorted(by_depth.keys()):
+            f.write(f"\n--- Depth {depth} ---\n")
+            _write_batched(f, (f"{chain.conclusion}\n  ← {chain.justification}\n"
+                               for chain in by_depth[depth]))
+        
+        f.write("\n")
+        
+        # Summary
+        f.write("═" * 70 + "\n")
+        f.write("SUMMARY\n")
+        f.write("═" * 70 + "\n")
+        f.write(f"Original facts: {len(result.original_facts) - len(result.original_rules)}\n")
+        f.write(f"Original rules: {len(result.original_rules)}\n")
+        f.write(f"Derived facts: {len(result.derived_facts)}\n")
+        f.write(f"Total facts: {result.count_all_facts()}\n")
+        f.write(f"Iterations: {result.iterations}\n")
+        
+        # Contradictions
+        if result.contradictions:
             f.write("\n")
-            
-            # Summary
             f.write("═" * 70 + "\n")
-            f.write("SUMMARY\n")
+            f.write("⚠️  CONTRADICTIONS DETECTED\n")
             f.write("═" * 70 + "\n")
-            f.write(f"Original facts: {len(result.original_facts) - len(result.original_rules)}\n")
-            f.write(f"Original rules: {len(result.original_rules)}\n")
-            f.write(f"Derived facts: {len(result.derived_facts)}\n")
-            f.write(f"Total facts: {len(result.get_all_facts())}\n")
-            f.write(f"Iterations: {result.iterations}\n")
-            
-            # Contradictions
-            if result.contradictions:
-                f.write("\n")
-                f.write("═" * 70 + "\n")
-                f.write("⚠️  CONTRADICTIONS DETECTED\n")
-                f.write("═" * 70 + "\n")
-                for contradiction in result.contradictions:
-                    f.write(f"{contradiction}\n")
-            
-            f.write("\n" + "═" * 70 + "\n")
+            _write_batched(f, (f"{contradiction}\n" for contradiction in result.contradictions))
+        
+        f.write("\n" + "═" * 70 + "\n")
+
+
+def _write_batched(f: TextIO, lines: Iterable[str], batch_size: int = EXPORT_BATCH_LINES):
+    """Write lines to a stream in batches, keeping at most one batch in memory."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            f.writelines(batch)
+            batch.clear()
+    if batch:
+        f.writelines(batch)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
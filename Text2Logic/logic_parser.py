@@ -16,8 +16,15 @@ Version: 1.0
 # IMPORTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+from __future__ import annotations
+
 import re
-from typing import Union, List, Tuple, Optional
+import sys
+import threading
+import weakref
+from collections import defaultdict, namedtuple
+from collections.abc import Iterable
+from functools import lru_cache
 from dataclasses import dataclass
 from enum import Enum
 
@@ -35,71 +42,281 @@ class LogicalOperator(Enum):
     IFF = "↔"
     
     @classmethod
-    def from_text(cls, text: str) -> Optional['LogicalOperator']:
+    def from_text(cls, text: str) -> LogicalOperator | None:
         """Convert text representation to operator."""
-        mapping = {
-            '∧': cls.AND, 'AND': cls.AND, '&': cls.AND, '^': cls.AND,
-            '∨': cls.OR, 'OR': cls.OR, '|': cls.OR, 'v': cls.OR,
-            '¬': cls.NOT, 'NOT': cls.NOT, '~': cls.NOT, '!': cls.NOT,
-            '→': cls.IMPLIES, 'IMPLIES': cls.IMPLIES, '->': cls.IMPLIES, '=>': cls.IMPLIES,
-            '↔': cls.IFF, 'IFF': cls.IFF, '<->': cls.IFF, '<=>': cls.IFF
-        }
-        return mapping.get(text.upper() if isinstance(text, str) else text)
+        operator = _TEXT_TO_OP.get(text)
+        if operator is None and isinstance(text, str):
+            # Word spellings are case-insensitive
+            operator = _TEXT_TO_OP.get(text.upper())
+        return operator
+
+
+# Operator spellings accepted by LogicalOperator.from_text, built once
+_TEXT_TO_OP = {
+    '∧': LogicalOperator.AND, 'AND': LogicalOperator.AND,
+    '&': LogicalOperator.AND, '^': LogicalOperator.AND,
+    '∨': LogicalOperator.OR, 'OR': LogicalOperator.OR,
+    '|': LogicalOperator.OR, 'v': LogicalOperator.OR,
+    '¬': LogicalOperator.NOT, 'NOT': LogicalOperator.NOT,
+    '~': LogicalOperator.NOT, '!': LogicalOperator.NOT,
+    '→': LogicalOperator.IMPLIES, 'IMPLIES': LogicalOperator.IMPLIES,
+    '->': LogicalOperator.IMPLIES, '=>': LogicalOperator.IMPLIES,
+    '↔': LogicalOperator.IFF, 'IFF': LogicalOperator.IFF,
+    '<->': LogicalOperator.IFF, '<=>': LogicalOperator.IFF,
+}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # AST NODE CLASSES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+# Canonical instances of interned atoms and expressions, keyed by structure.
+# Entries disappear once nothing else references the instance.
+_INTERN = weakref.WeakValueDictionary()
+# Held while creating and registering a canonical instance, so threads
+# interning the same term concurrently (RuleManager with max_workers > 1)
+# cannot each register their own
+_INTERN_LOCK = threading.Lock()
+
+# Number of (pattern, fact) unification results kept by Atom.matches
+MATCH_CACHE_SIZE = 65536
+
+# Number of parse results kept by parse_expression
+PARSE_CACHE_SIZE = 8192
+
+# Separator between the operands of each operator in text form
+_SEP = {operator: f" {operator.value} " for operator in LogicalOperator}
+
+# Associative-commutative operators: operand order and nesting carry no meaning
+_AC_OPERATORS = frozenset({LogicalOperator.AND, LogicalOperator.OR})
+
+# Tokenizer: one alternation tried at each position, atoms first (capturing
+# their parts), then longer operator spellings before their prefixes
+_TOKEN_RE = re.compile(r'''
+    (?P<atom>\((?P<subject>[^)]+)\)(?P<relation>[A-Za-z_][A-Za-z0-9_]*)\((?P<objects>[^)]*)\))
+  | (?P<iff><->|<=>|↔)
+  | (?P<implies>->|=>|→)
+  | (?P<and>[∧&^])
+  | (?P<or>[∨|v])
+  | (?P<not>[¬~!])
+  | (?P<ws>\s+)
+  | (?P<err>.)
+''', re.VERBOSE | re.DOTALL)
+
+# Token kinds: the parser dispatches on these small ints, so its token
+# tests are integer compares rather than string compares
+_TOK_ATOM, _TOK_NOT, _TOK_AND, _TOK_OR, _TOK_IMPLIES, _TOK_IFF = range(6)
+
+# Kind of each operator group of _TOKEN_RE, and the normalized symbol of
+# each operator kind (kept as the token itself, for error messages)
+_TOKEN_KINDS = {'iff': _TOK_IFF, 'implies': _TOK_IMPLIES, 'and': _TOK_AND,
+                'or': _TOK_OR, 'not': _TOK_NOT}
+_TOKEN_SYMBOLS = (None, '¬', '∧', '∨', '→', '↔')
+
+# Binary operators by token kind: (precedence, operator), higher binds
+# tighter; None for kinds that are not binary operators. ¬ is a prefix
+# operator and binds tighter than all of them.
+_BINARY_OPERATORS = (
+    None,
+    None,
+    (4, LogicalOperator.AND),
+    (3, LogicalOperator.OR),
+    (2, LogicalOperator.IMPLIES),
+    (1, LogicalOperator.IFF),
+)
+
+
+class _AtomToken(namedtuple('_AtomToken', 'text subject relation objects')):
+    """Atom token with the parts the tokenizer already matched."""
+    __slots__ = ()
+    
+    def __str__(self):
+        return self.text
+
+
+# Term kind tag: atoms carry KIND_ATOM, expressions carry their operator, so
+# hot loops can dispatch on one attribute instead of isinstance checks
+KIND_ATOM = 0
+
+# Atoms and expressions are frozen; their cached attributes are set past
+# the dataclass guard with this
+_set_cached = object.__setattr__
+
+
+@dataclass(frozen=True)
 class Atom:
     """Represents an atomic proposition: (Subject)Relation(Object)"""
     subject: str
     relation: str
-    objects: List[str]
+    objects: tuple[str, ...]
+    
+    # Set on the canonical instances handed out by intern()
+    _interned = False
+    # Text form, cached on first use
+    _str = None
+    
+    def __post_init__(self):
+        objects = self.objects
+        if type(objects) is not tuple:
+            objects = tuple(objects)
+        # Cached once: rules use them to pick hash lookups over unification
+        # and to skip substituting into terms a binding cannot touch. Atoms
+        # are immutable, so the hash is cached too. All of it goes in with
+        # one dict update rather than a frozen-safe setattr per attribute.
+        terms = (self.subject, *objects)
+        free_vars = frozenset([term for term in terms if _is_variable_name(term)])
+        self.__dict__.update(
+            objects=objects,
+            kind=KIND_ATOM,
+            _terms=terms,
+            _free_vars=free_vars,
+            has_variables=bool(free_vars),
+            _hash=hash((self.subject, self.relation, objects)),
+        )
     
     def __str__(self):
-        if not self.objects:
-            return f"({self.subject}){self.relation}()"
-        return f"({self.subject}){self.relation}({', '.join(self.objects)})"
+        if self._str is None:
+            if not self.objects:
+                text = f"({self.subject}){self.relation}()"
+            else:
+                text = f"({self.subject}){self.relation}({', '.join(self.objects)})"
+            _set_cached(self, '_str', text)
+        return self._str
     
     def __hash__(self):
-        return hash((self.subject, self.relation, tuple(self.objects)))
+        return self._hash
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        # Unpickled canonical atoms go back through intern(), so the
+        # identity shortcut in __eq__ stays valid
+        if self._interned:
+            return Atom.intern, (self.subject, self.relation, self.objects)
+        return type(self), (self.subject, self.relation, self.objects)
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Atom):
             return False
+        # Distinct canonical atoms never compare equal, and neither do
+        # atoms whose cached hashes differ
+        if (self._interned and other._interned) or self._hash != other._hash:
+            return False
         return (self.subject == other.subject and 
                 self.relation == other.relation and 
                 self.objects == other.objects)
     
-    def matches(self, other: 'Atom', bindings: dict = None) -> Tuple[bool, dict]:
+    @classmethod
+    def intern(cls, subject: str, relation: str, objects: Iterable[str]) -> Atom:
+        """
+        Get the canonical atom for the given parts, creating it if needed.
+        
+        Interned atoms are shared, so equal atoms usually compare by identity
+        and repeated unification of the same pair hits the match cache.
+        """
+        objects = tuple(objects)
+        key = (cls, subject, relation, objects)
+        atom = _INTERN.get(key)
+        if atom is None:
+            with _INTERN_LOCK:
+                atom = _INTERN.get(key)
+                if atom is None:
+                    atom = cls(subject, relation, objects)
+                    _set_cached(atom, '_interned', True)
+                    _INTERN[key] = atom
+        return atom
+    
+    def matches(self, other: Atom, bindings: dict = None) -> tuple[bool, dict]:
         """
         Check if this atom matches another, supporting variable unification.
-        Variables start with 'X', 'Y', 'Z' or end with numbers like X1, Y2.
+        Variables are 'X', 'Y', 'Z', optionally numbered like X1, Y2.
         """
-        if bindings is None:
-            bindings = {}
+        if not self.has_variables and not other.has_variables:
+            # Ground atoms unify only with an equal atom, binding nothing
+            if self == other:
+                return True, dict(bindings) if bindings else {}
+            return False, {}
+        if not bindings:
+            # Fresh unifications are memoized; hand out a private copy
+            matched, new_bindings = _match_atoms(self, other)
+            return matched, dict(new_bindings)
+        return self._unify(other, bindings)
+    
+    def unifier(self, other: Atom) -> dict | None:
+        """
+        Bindings that unify this atom with another, or None if they do not match.
         
-        new_bindings = bindings.copy()
+        Like matches() without prior bindings, but hands out the memoized
+        bindings themselves: the result is shared and must not be mutated.
+        """
+        if not self.has_variables and not other.has_variables:
+            return _NO_BINDINGS if self == other else None
+        matched, bindings = _match_atoms(self, other)
+        return bindings if matched else None
+    
+    def bind(self, other: Atom, bindings: dict, trail: list[str] | None = None) -> bool:
+        """
+        Unify with another atom, extending bindings in place.
         
-        # Relations must match exactly
-        if self.relation != other.relation:
-            return False, {}
+        Same rules as _match_term(), inlined over the cached term tuples and
+        variable sets so no term is classified again. On failure the bindings
+        made by this call are undone, leaving bindings as it was.
         
-        # Match subject
-        if not self._match_term(self.subject, other.subject, new_bindings):
-            return False, {}
+        Args:
+            other: Atom to unify with
+            bindings: Variable bindings to check against and extend
+            trail: If given, the variables bound are appended to it, so a
+                caller backtracking over several atoms can undo them together
         
-        # Match objects (must have same arity)
-        if len(self.objects) != len(other.objects):
-            return False, {}
+        Returns:
+            True if the atoms unify under the extended bindings
+        """
+        if not self.has_variables and not other.has_variables:
+            return self == other
+        
+        # Relations must match exactly, and so must the arity
+        if self.relation != other.relation or len(self._terms) != len(other._terms):
+            return False
         
-        for obj1, obj2 in zip(self.objects, other.objects):
-            if not self._match_term(obj1, obj2, new_bindings):
-                return False, {}
+        added = []
+        vars1 = self._free_vars
+        vars2 = other._free_vars
+        for term1, term2 in zip(self._terms, other._terms):
+            if term1 in vars1:
+                variable, value = term1, term2
+            elif term2 in vars2:
+                variable, value = term2, term1
+            elif term1 == term2:
+                continue
+            else:
+                break
+            # Bind the variable, or check the value it is already bound to
+            if variable not in bindings:
+                bindings[variable] = value
+                added.append(variable)
+            elif bindings[variable] != value:
+                break
+        else:
+            if trail is not None:
+                trail.extend(added)
+            return True
         
-        return True, new_bindings
+        for variable in added:
+            del bindings[variable]
+        return False
+    
+    def _unify(self, other: Atom, bindings: dict) -> tuple[bool, dict]:
+        """Unify with another atom, extending a copy of bindings."""
+        new_bindings = dict(bindings)
+        if self.bind(other, new_bindings):
+            return True, new_bindings
+        return False, {}
     
     def _match_term(self, term1: str, term2: str, bindings: dict) -> bool:
         """Match two terms, handling variables."""
@@ -129,25 +346,66 @@ class Atom:
         return False
     
     def _is_variable(self, term: str) -> bool:
-        """Check if a term is a variable."""
-        return (term.startswith('X') or term.startswith('Y') or 
-                term.startswith('Z') or 
-                re.match(r'^[XYZ]\d+$', term) is not None)
+        """Check if a term is a variable (X, Y, Z, optionally followed by digits)."""
+        return _is_variable_name(term)
     
-    def substitute(self, bindings: dict) -> 'Atom':
+    def substitute(self, bindings: dict) -> Atom:
         """Create a new atom with variables substituted."""
-        new_subject = bindings.get(self.subject, self.subject)
-        new_objects = [bindings.get(obj, obj) for obj in self.objects]
-        return Atom(new_subject, self.relation, new_objects)
+        # Nothing to replace: the canonical atom is already the result
+        if self._interned and not any(term in bindings for term in self._terms):
+            return self
+        get = bindings.get
+        return Atom.intern(get(self.subject, self.subject), self.relation,
+                           tuple(get(obj, obj) for obj in self.objects))
+
+
+def _is_variable_name(term: str) -> bool:
+    """Check if a term is a variable (X, Y, Z, optionally followed by digits)."""
+    return term[:1] in ('X', 'Y', 'Z') and (len(term) == 1 or term[1:].isdecimal())
+
 
+# Shared (read-only) bindings of a ground-to-ground unification
+_NO_BINDINGS = {}
 
-@dataclass
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _match_atoms(pattern: Atom, fact: Atom) -> tuple[bool, dict]:
+    """Memoized Atom.matches without prior bindings (result must not be mutated)."""
+    return pattern._unify(fact, {})
+
+
+@dataclass(frozen=True)
 class LogicalExpression:
     """Represents a logical expression with operators."""
-    operator: Optional[LogicalOperator]
-    operands: List[Union[Atom, 'LogicalExpression']]
+    operator: LogicalOperator | None
+    operands: tuple[Atom | LogicalExpression, ...]
+    
+    # Set on the canonical instances handed out by intern()
+    _interned = False
+    # Text form, cached on first use
+    _str = None
+    
+    def __post_init__(self):
+        operands = self.operands
+        if type(operands) is not tuple:
+            operands = tuple(operands)
+        # Expressions are immutable: cache hash and text, which rules
+        # otherwise recompute over the whole tree for every lookup and
+        # justification (set in one update, as in Atom)
+        self.__dict__.update(
+            operands=operands,
+            kind=self.operator,
+            _free_vars=frozenset().union(*[operand._free_vars for operand in operands]),
+            _hash=hash((self.operator, operands)),
+        )
     
     def __str__(self):
+        if self._str is None:
+            _set_cached(self, '_str', self._format())
+        return self._str
+    
+    def _format(self) -> str:
+        """Build the text form of the expression."""
         if self.operator is None:
             # Single atom
             return str(self.operands[0]) if self.operands else ""
@@ -155,20 +413,135 @@ class LogicalExpression:
         if self.operator == LogicalOperator.NOT:
             return f"¬{self.operands[0]}"
         
-        op_symbol = self.operator.value
-        operand_strs = [str(op) for op in self.operands]
-        return f"({' {} '.format(op_symbol).join(operand_strs)})"
+        return f"({_SEP[self.operator].join(map(str, self.operands))})"
+    
+    @classmethod
+    def intern(cls, operator: LogicalOperator | None,
+               operands: Iterable[Atom | LogicalExpression]) -> LogicalExpression:
+        """
+        Get the canonical expression for operator and operands.
+        
+        AND/OR operands are flattened and sorted first, so A ∧ B and B ∧ A
+        (or A ∧ (B ∧ C) and (A ∧ B) ∧ C) intern to the same expression.
+        
+        The key uses operand identity, so the operands are interned first
+        (a no-op for parsed ones): equal expressions then always share one
+        canonical instance, which Atom/LogicalExpression.__eq__ rely on. The
+        canonical instance keeps its operands alive, which keeps their ids
+        stable for as long as the entry exists.
+        """
+        operands = [intern_term(operand) for operand in operands]
+        if operator in _AC_OPERATORS:
+            operands = _canonical_operands(operator, operands)
+        operands = tuple(operands)
+        key = (cls, operator, tuple(map(id, operands)))
+        expr = _INTERN.get(key)
+        if expr is None:
+            with _INTERN_LOCK:
+                expr = _INTERN.get(key)
+                if expr is None:
+                    expr = cls(operator, operands)
+                    _set_cached(expr, '_interned', True)
+                    _INTERN[key] = expr
+        return expr
     
     def __hash__(self):
-        return hash((self.operator, tuple(self.operands)))
+        return self._hash
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        # See Atom.__reduce__
+        if self._interned:
+            return LogicalExpression.intern, (self.operator, self.operands)
+        return type(self), (self.operator, self.operands)
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, LogicalExpression):
             return False
+        # Same shortcuts as Atom.__eq__: no tree walk unless one side was
+        # built outside intern() and the hashes agree
+        if (self._interned and other._interned) or self._hash != other._hash:
+            return False
         return (self.operator == other.operator and 
                 self.operands == other.operands)
 
 
+def _canonical_operands(operator: LogicalOperator, operands) -> list:
+    """Flatten nested same-operator operands and sort them by their text."""
+    flat = []
+    for operand in operands:
+        if operand.kind is operator:
+            flat.extend(_canonical_operands(operator, operand.operands))
+        else:
+            flat.append(operand)
+    flat.sort(key=str)
+    return flat
+
+
+class AtomIndex:
+    """
+    Atoms bucketed by (relation, arity) for pattern lookups.
+    
+    Atoms only unify when relation and arity agree, so a pattern is tried
+    against its own bucket rather than every atom. Ground atoms are also
+    kept in a set, which answers ground patterns by hash lookup.
+    """
+    
+    def __init__(self, atoms: Iterable[Atom] = ()):
+        """
+        Args:
+            atoms: Atoms to index
+        """
+        self.ground = set()
+        self.by_key = defaultdict(list)
+        self.var_by_key = defaultdict(list)
+        self.update(atoms)
+    
+    def add(self, atom: Atom):
+        """Index a single atom."""
+        key = (atom.relation, len(atom.objects))
+        self.by_key[key].append(atom)
+        if atom.has_variables:
+            self.var_by_key[key].append(atom)
+        else:
+            self.ground.add(atom)
+    
+    def update(self, atoms: Iterable[Atom]):
+        """Index each of atoms."""
+        add = self.add
+        for atom in atoms:
+            add(atom)
+    
+    def candidates(self, pattern: Atom) -> list[Atom]:
+        """
+        Indexed atoms that might unify with pattern.
+        
+        A ground pattern found among the ground atoms is returned first; the
+        caller still has to unify each candidate.
+        
+        Args:
+            pattern: Atom to look up
+        
+        Returns:
+            Candidate atoms (not to be mutated)
+        """
+        key = (pattern.relation, len(pattern.objects))
+        if pattern.has_variables:
+            return self.by_key.get(key, [])
+        # Atoms with variables can still unify with a ground pattern
+        candidates = self.var_by_key.get(key, [])
+        if pattern in self.ground:
+            return [pattern] + candidates
+        return candidates
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PARSER CLASS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -194,7 +567,7 @@ class LogicParser:
         self.tokens = []
         self.position = 0
     
-    def parse(self, text: str) -> Union[Atom, LogicalExpression]:
+    def parse(self, text: str) -> Atom | LogicalExpression:
         """
         Parse a logical expression from text.
         
@@ -207,179 +580,165 @@ class LogicParser:
         Raises:
             ValueError: If the expression is malformed
         """
-        text = text.strip()
-        self.tokens = self._tokenize(text)
+        # Surrounding whitespace needs no strip(): the tokenizer skips it
+        # like any other whitespace. The parse methods pass the token list
+        # and position along as locals; the attributes only record where
+        # parsing stopped
+        kinds, tokens = self._tokenize(text)
+        self.tokens = tokens
         self.position = 0
         
-        if not self.tokens:
+        if not tokens:
             raise ValueError("Empty expression")
         
-        result = self._parse_iff()
+        result, position = self._parse_expression(kinds, tokens, 0, 0)
+        self.position = position
         
-        if self.position < len(self.tokens):
-            raise ValueError(f"Unexpected token: {self.tokens[self.position]}")
+        if position < len(tokens):
+            raise ValueError(f"Unexpected token: {tokens[position]}")
         
         return result
     
-    def _tokenize(self, text: str) -> List[str]:
+    def parse_many(self, texts: Iterable[str]) -> list[Atom | LogicalExpression]:
         """
-        Tokenize the input text into atoms and operators.
+        Parse several logical expressions with this parser.
         
-        Returns list of tokens in order.
-        """
-        tokens = []
-        i = 0
+        Args:
+            texts: Strings containing logical expressions
         
-        while i < len(text):
-            # Skip whitespace
-            if text[i].isspace():
-                i += 1
-                continue
-            
-            # Check for atoms first: (Subject)Relation(Object)
-            atom_match = re.match(
-                r'\([^)]+\)[A-Za-z_][A-Za-z0-9_]*\([^)]*\)',
-                text[i:]
-            )
-            if atom_match:
-                tokens.append(atom_match.group(0))
-                i += len(atom_match.group(0))
-                continue
-            
-            # Check for multi-character operators
-            if i + 1 < len(text):
-                two_char = text[i:i+2]
-                if two_char in ['→', '↔', '->', '=>', '<->',  '<=>']: 
-                    if two_char == '->':
-                        tokens.append('→')
-                    elif two_char == '=>':
-                        tokens.append('→')
-                    elif two_char == '<->':
-                        tokens.append('↔')
-                    elif two_char == '<=>':
-                        tokens.append('↔')
-                    else:
-                        tokens.append(two_char)
-                    i += 2
-                    continue
-            
-            # Check for single-character operators and symbols
-            if text[i] in ['∧', '∨', '¬', '→', '↔', '&', '|', '~', '!', '^', 'v']:
-                char = text[i]
-                # Normalize symbols
-                if char == '&' or char == '^':
-                    tokens.append('∧')
-                elif char == '|' or char == 'v':
-                    tokens.append('∨')
-                elif char == '~' or char == '!':
-                    tokens.append('¬')
-                else:
-                    tokens.append(char)
-                i += 1
-                continue
-            
-            # Unknown character
-            raise ValueError(f"Unexpected character: {text[i]} at position {i}")
+        Returns:
+            Parsed expressions, in order
         
-        return tokens
+        Raises:
+            ValueError: If any expression is malformed
+        """
+        parse = self.parse
+        return [parse(text) for text in texts]
     
-    def _parse_iff(self) -> Union[Atom, LogicalExpression]:
-        """Parse IFF (biconditional) - lowest precedence."""
-        left = self._parse_implies()
-        
-        while self.position < len(self.tokens) and self.tokens[self.position] == '↔':
-            self.position += 1
-            right = self._parse_implies()
-            left = LogicalExpression(LogicalOperator.IFF, [left, right])
+    def _tokenize(self, text: str) -> tuple[list[int], list[str | _AtomToken]]:
+        """
+        Tokenize the input text into atoms and operators.
         
-        return left
-    
-    def _parse_implies(self) -> Union[Atom, LogicalExpression]:
-        """Parse IMPLIES (implication)."""
-        left = self._parse_or()
+        Returns:
+            Tuple of (token kinds, tokens) in order: operator tokens are
+            their normalized symbol, atoms are _AtomToken
+        """
+        kinds = []
+        tokens = []
         
-        while self.position < len(self.tokens) and self.tokens[self.position] == '→':
-            self.position += 1
-            right = self._parse_or()
-            left = LogicalExpression(LogicalOperator.IMPLIES, [left, right])
+        for match in _TOKEN_RE.finditer(text):
+            group = match.lastgroup
+            if group == 'atom':
+                # (Subject)Relation(Object)
+                kinds.append(_TOK_ATOM)
+                tokens.append(_AtomToken(*match.group('atom', 'subject', 'relation', 'objects')))
+            elif group == 'ws':
+                continue
+            elif group == 'err':
+                raise ValueError(f"Unexpected character: {match.group()} at position {match.start()}")
+            else:
+                kind = _TOKEN_KINDS[group]
+                kinds.append(kind)
+                tokens.append(_TOKEN_SYMBOLS[kind])
         
-        return left
+        return kinds, tokens
     
-    def _parse_or(self) -> Union[Atom, LogicalExpression]:
-        """Parse OR (disjunction)."""
-        left = self._parse_and()
-        
-        operands = [left]
-        while self.position < len(self.tokens) and self.tokens[self.position] == '∨':
-            self.position += 1
-            operands.append(self._parse_and())
+    def _parse_expression(self, kinds: list[int], tokens: list, position: int,
+                          min_precedence: int) -> tuple[Atom | LogicalExpression, int]:
+        """
+        Parse binary operators binding at least as tight as min_precedence.
         
-        if len(operands) == 1:
-            return operands[0]
-        return LogicalExpression(LogicalOperator.OR, operands)
-    
-    def _parse_and(self) -> Union[Atom, LogicalExpression]:
-        """Parse AND (conjunction)."""
-        left = self._parse_not()
+        Precedence climbing over _BINARY_OPERATORS: IFF and IMPLIES associate
+        to the left, runs of AND or OR become one n-ary expression.
         
-        operands = [left]
-        while self.position < len(self.tokens) and self.tokens[self.position] == '∧':
-            self.position += 1
-            operands.append(self._parse_not())
+        Returns:
+            Tuple of (parsed expression, position of the next token)
+        """
+        left, position = self._parse_not(kinds, tokens, position)
+        end = len(kinds)
+        
+        while position < end:
+            kind = kinds[position]
+            entry = _BINARY_OPERATORS[kind]
+            if entry is None or entry[0] < min_precedence:
+                break
+            precedence, operator = entry
+            
+            right, position = self._parse_expression(kinds, tokens, position + 1, precedence + 1)
+            if operator in _AC_OPERATORS and position < end and kinds[position] == kind:
+                # A run of the same AND/OR becomes one n-ary expression; a
+                # list is only built once there is a third operand
+                operands = [left, right]
+                while position < end and kinds[position] == kind:
+                    right, position = self._parse_expression(kinds, tokens, position + 1,
+                                                             precedence + 1)
+                    operands.append(right)
+            else:
+                operands = (left, right)
+            left = LogicalExpression.intern(operator, operands)
         
-        if len(operands) == 1:
-            return operands[0]
-        return LogicalExpression(LogicalOperator.AND, operands)
+        return left, position
     
-    def _parse_not(self) -> Union[Atom, LogicalExpression]:
+    def _parse_not(self, kinds: list[int], tokens: list,
+                   position: int) -> tuple[Atom | LogicalExpression, int]:
         """Parse NOT (negation) - highest precedence."""
-        if self.position < len(self.tokens) and self.tokens[self.position] == '¬':
-            self.position += 1
-            operand = self._parse_not()
-            return LogicalExpression(LogicalOperator.NOT, [operand])
+        if position < len(kinds) and kinds[position] == _TOK_NOT:
+            operand, position = self._parse_not(kinds, tokens, position + 1)
+            return LogicalExpression.intern(LogicalOperator.NOT, (operand,)), position
         
-        return self._parse_atom()
+        return self._parse_atom(kinds, tokens, position)
     
-    def _parse_atom(self) -> Atom:
+    def _parse_atom(self, kinds: list[int], tokens: list, position: int) -> tuple[Atom, int]:
         """Parse an atomic proposition."""
-        if self.position >= len(self.tokens):
+        if position >= len(kinds):
             raise ValueError("Unexpected end of expression")
         
-        token = self.tokens[self.position]
-        self.position += 1
+        kind = kinds[position]
+        token = tokens[position]
+        position += 1
         
-        # Parse atom format: (Subject)Relation(Object)
-        match = re.match(r'\(([^)]+)\)([A-Za-z_][A-Za-z0-9_]*)\(([^)]*)\)', token)
-        if not match:
+        # Atom format: (Subject)Relation(Object), split by the tokenizer
+        if kind != _TOK_ATOM:
             raise ValueError(f"Invalid atom format: {token}. Expected: (Subject)Relation(Object)")
         
-        subject = match.group(1).strip()
-        relation = match.group(2).strip()
-        objects_str = match.group(3).strip()
+        subject = token.subject.strip()
+        relation = token.relation
+        objects_str = token.objects.strip()
         
         # Validate subject and objects don't contain invalid characters
         if '(' in subject or ')' in subject:
             raise ValueError(f"Subject contains invalid parentheses: {subject}")
         
         if objects_str:
-            objects = [obj.strip() for obj in objects_str.split(',')]
+            if ',' in objects_str:
+                objects = tuple(obj.strip() for obj in objects_str.split(','))
+            else:
+                objects = (objects_str,)
             for obj in objects:
                 if '(' in obj or ')' in obj:
                     raise ValueError(f"Object contains invalid parentheses: {obj}")
         else:
-            objects = []
+            objects = ()
         
-        return Atom(subject, relation, objects)
+        # Interned strings make the term comparisons in unification and the
+        # intern table lookups identity checks for repeated names
+        return Atom.intern(sys.intern(subject), sys.intern(relation),
+                           tuple(map(sys.intern, objects))), position
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # UTILITY FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def parse_expression(text: str) -> Union[Atom, LogicalExpression]:
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_expression(text: str) -> Atom | LogicalExpression:
     """
     Convenience function to parse a logical expression.
     
+    Results are memoized, so repeated fact, rule and query strings are
+    parsed once. The returned terms are interned and shared: callers must
+    not mutate them.
+    
     Args:
         text: String containing the logical expression
     
@@ -390,6 +749,41 @@ def parse_expression(text: str) -> Union[Atom, LogicalExpression]:
     return parser.parse(text)
 
 
+def parse_many(texts: Iterable[str]) -> list[Atom | LogicalExpression]:
+    """
+    Parse several logical expressions, sharing parse_expression's cache.
+    
+    Args:
+        texts: Strings containing logical expressions
+    
+    Returns:
+        Parsed Atoms or LogicalExpressions, in order
+    """
+    return list(map(parse_expression, texts))
+
+
+def intern_term(term: Atom | LogicalExpression) -> Atom | LogicalExpression:
+    """
+    Get the canonical instance of a term built outside the parser.
+    
+    Parsed terms are already interned and returned as is; hand-built ones
+    are interned bottom-up, so they share identity (and the match cache)
+    with every equal term.
+    
+    Args:
+        term: Atom or LogicalExpression
+    
+    Returns:
+        The interned equivalent of term
+    """
+    if term._interned:
+        return term
+    if term.kind is KIND_ATOM:
+        return Atom.intern(term.subject, term.relation, term.objects)
+    # intern() interns the operands itself
+    return LogicalExpression.intern(term.operator, term.operands)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN EXECUTION BLOCK (FOR TESTING)
 # ═══════════════════════════════════════════════════════════════════════════════
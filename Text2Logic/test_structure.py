@@ -175,6 +175,842 @@ def test_deduction_rules():
         return False
 
 
+def test_interning():
+    """Test that interned terms equal every equal term, however it was built."""
+    print("\nTesting interning and equality...")
+    try:
+        import copy
+        import pickle
+        from Text2Logic.logic_parser import (
+            parse_expression, intern_term, Atom, LogicalExpression, LogicalOperator
+        )
+        
+        # Interning hand-built operands twice gives one canonical instance
+        first = LogicalExpression.intern(LogicalOperator.NOT, [Atom("a", "R", ["b"])])
+        second = LogicalExpression.intern(LogicalOperator.NOT, [Atom("a", "R", ["b"])])
+        parsed = parse_expression("¬(a)R(b)")
+        assert first is second, "Equal interned expressions should be shared"
+        assert first == parsed and hash(first) == hash(parsed), "Should equal parsed term"
+        print("  ✓ Interned expressions are canonical")
+        
+        # Terms built without intern() compare structurally
+        built = LogicalExpression(LogicalOperator.NOT, [Atom("a", "R", ["b"])])
+        assert built == parsed and parsed == built, "Plain term should equal interned one"
+        assert intern_term(built) is parsed, "intern_term should return the parsed instance"
+        assert len({first, second, parsed, built}) == 1, "Set should deduplicate equal terms"
+        print("  ✓ Plain and interned terms compare equal")
+        
+        # AND/OR operand order and nesting do not matter
+        conj = parse_expression("(a)R(b) ∧ (c)S() ∧ (d)T()")
+        nested = LogicalExpression.intern(LogicalOperator.AND, [
+            Atom("d", "T", []),
+            LogicalExpression(LogicalOperator.AND, [Atom("c", "S", []), Atom("a", "R", ["b"])]),
+        ])
+        assert conj is nested, "Conjunctions should intern order-independently"
+        assert parse_expression("(a)R(b)") != parse_expression("(a)R(c)"), "Different atoms"
+        print("  ✓ Conjunctions are canonical")
+        
+        # Shared instances cannot be modified in place
+        import dataclasses
+        for term, field in ((conj, "operands"), (parsed.operands[0], "subject")):
+            try:
+                setattr(term, field, ())
+            except dataclasses.FrozenInstanceError:
+                pass
+            else:
+                raise AssertionError(f"{type(term).__name__}.{field} should be read-only")
+        assert len(conj.operands) == 3, "Failed assignment should leave the term intact"
+        print("  ✓ Terms are immutable")
+        
+        # Copies stay canonical
+        assert copy.deepcopy(parsed) is parsed, "deepcopy should keep identity"
+        assert pickle.loads(pickle.dumps(parsed)) is parsed, "pickle should re-intern"
+        print("  ✓ Copies and pickles stay canonical")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Interning error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_convert_retries_failures():
+    """Test that failed conversions are not served from a cache."""
+    print("\nTesting conversion caching (without Ollama)...")
+    from Text2Logic import api
+    model_name = "test-convert-cache"
+    try:
+        converter = api._get_converter(model_name)
+        replies = [None, "(Pedro)IsA(estudiante)"]
+        calls = []
+        
+        def fake_request(sentence, max_retries):
+            calls.append(sentence)
+            return replies[len(calls) - 1]
+        
+        converter._request_conversion = fake_request
+        
+        # Ollama "down": nothing converted
+        assert api.convert_text("Pedro es estudiante.", model_name=model_name) == ([], [])
+        # Ollama "back": the same text is converted again
+        facts, rules = api.convert_text("Pedro es estudiante.", model_name=model_name)
+        assert facts == ["(Pedro)IsA(estudiante)"], f"Unexpected facts: {facts}"
+        print("  ✓ Failed conversion retried on the next call")
+        
+        # Successes are cached: no third request
+        facts, rules = api.convert_text("Pedro es estudiante.", model_name=model_name)
+        assert facts == ["(Pedro)IsA(estudiante)"] and len(calls) == 2, "Should hit the cache"
+        facts.append("mutated")
+        assert api.convert_text("Pedro es estudiante.", model_name=model_name)[0] == [
+            "(Pedro)IsA(estudiante)"], "Callers should get fresh lists"
+        print("  ✓ Successful conversion cached")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Conversion cache error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        api._CONVERTER_POOL.pop(model_name, None)
+
+
+def test_streamed_response():
+    """Test reading streamed model output (without Ollama)."""
+    print("\nTesting streamed responses (without Ollama)...")
+    try:
+        import json
+        from Text2Logic.text_to_logic import TextToLogicConverter
+        
+        class FakeResponse:
+            """Streaming response yielding the given NDJSON lines."""
+            status_code = 200
+            
+            def __init__(self, lines):
+                self.lines = lines
+            
+            def iter_lines(self):
+                return iter(self.lines)
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                return False
+        
+        def chunks(text, size=5):
+            lines = [json.dumps({"response": text[i:i + size], "done": False}).encode()
+                     for i in range(0, len(text), size)]
+            return lines + [json.dumps({"response": "", "done": True}).encode()]
+        
+        converter = TextToLogicConverter()
+        
+        # Valid lines are kept whole, including those after commentary
+        raw = ("Sure:\n(Pedro)IsA(estudiante)\nRule: (X)IsA(estudiante) -> (X)Estudia()"
+               "\nThis means that Pedro studies.\n(Bob)IsA(padre)")
+        for size in (1, 5, 64):
+            text = converter._read_streamed_response(FakeResponse(chunks(raw, size)))
+            assert text == converter._clean_response(raw), text
+        assert text.endswith("(Bob)IsA(padre)"), "Lines after commentary should be kept"
+        print("  ✓ Streamed answer collected, commentary skipped")
+        
+        # A malformed chunk is retried like a network error, not raised
+        class FakeSession:
+            def __init__(self, responses):
+                self.responses = responses
+            
+            def post(self, *args, **kwargs):
+                return self.responses.pop(0)
+        
+        converter.session = FakeSession([FakeResponse([b'{"response": "(Pedro)Is']),
+                                         FakeResponse(chunks("(Pedro)IsA(estudiante)"))])
+        assert converter.convert_sentence("Pedro es estudiante", max_retries=2) == \
+            "(Pedro)IsA(estudiante)", "Should retry after a malformed chunk"
+        converter.session = FakeSession([FakeResponse([b'not json']) for _ in range(3)])
+        facts, rules = converter.convert_text("Bob trabaja.", verbose=False)
+        assert (facts, rules) == ([], []), "Malformed output should count as a failure"
+        print("  ✓ Malformed chunks retried, then reported as a failed conversion")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Streaming error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_load_from_file():
+    """Test reading .inf files: whitespace, comments and warning order."""
+    print("\nTesting .inf file loading...")
+    try:
+        import contextlib
+        import io
+        import tempfile
+        from Text2Logic.logic_engine import LogicEngine
+        from Text2Logic.logic_parser import parse_expression
+        
+        content = (
+            "# Facts\n"
+            "\u00a0(Pedro)IsA(estudiante)\f\n"           # NBSP / form feed around a fact
+            "\v(Bob)Trabaja(Microsoft)  # inline comment\n"
+            "   \n"
+            "broken(\n"
+            "\tRule:\u00a0(X)IsA(estudiante) → (X)Estudia()\v\n"
+            "Rule: bad(\n"
+            "   # indented comment\n"
+        )
+        with tempfile.NamedTemporaryFile('w', suffix='.inf', encoding='utf-8',
+                                         delete=False) as f:
+            f.write(content)
+        try:
+            engine = LogicEngine()
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                engine.load_from_file(f.name)
+        finally:
+            os.remove(f.name)
+        
+        expected = {parse_expression(text) for text in (
+            "(Pedro)IsA(estudiante)",
+            "(Bob)Trabaja(Microsoft)",
+            "(X)IsA(estudiante) → (X)Estudia()",
+        )}
+        assert set(engine.knowledge_base) == expected, f"Unexpected KB: {engine.knowledge_base}"
+        print("  ✓ Facts and rules read despite surrounding whitespace")
+        
+        warnings = [line for line in output.getvalue().splitlines()
+                    if line.startswith("Warning")]
+        assert warnings == ["Warning: Could not parse line: broken(",
+                            "Warning: Could not parse line: Rule: bad("], warnings
+        print("  ✓ Parse warnings reported in file order")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ File loading error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_read_text_file():
+    """Test reading input text from regular files and pipes."""
+    print("\nTesting input text reading...")
+    try:
+        import tempfile
+        import threading
+        from Text2Logic.text_to_logic import _read_text_file
+        
+        for raw, expected in ((b"", ""),
+                              (b"Pedro es estudiante.\r\nAna trabaja.\r", "Pedro es estudiante.\nAna trabaja.\n"),
+                              ("Jos\u00e9 estudia.".encode('latin-1'), "Jos\u00e9 estudia.")):
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(raw)
+            try:
+                text = _read_text_file(f.name)
+            finally:
+                os.remove(f.name)
+            assert text == expected, f"Read {text!r}, expected {expected!r}"
+        print("  ✓ Empty, CRLF and latin-1 files decoded")
+        
+        assert _read_text_file(f.name) is None, "Missing file should give None"
+        print("  ✓ Missing file gives None")
+        
+        if os.path.isdir('/dev/fd'):
+            read_fd, write_fd = os.pipe()
+            
+            def feed():
+                with os.fdopen(write_fd, 'wb') as pipe:
+                    pipe.write("Pedro es estudiante.\n".encode('utf-8'))
+            
+            writer = threading.Thread(target=feed)
+            writer.start()
+            try:
+                text = _read_text_file(f'/dev/fd/{read_fd}')
+            finally:
+                writer.join()
+                os.close(read_fd)
+            assert text == "Pedro es estudiante.\n", f"Read {text!r} from a pipe"
+            print("  ✓ Text read from a pipe")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Input text reading error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_parallel_inference():
+    """Test that applying rules on a thread pool derives the same facts."""
+    print("\nTesting parallel inference...")
+    try:
+        from Text2Logic.logic_engine import LogicEngine
+        
+        def run(parallel):
+            engine = LogicEngine(max_iterations=10, parallel=parallel)
+            engine.rule_manager.max_workers = 4 if parallel else 1
+            for i in range(30):
+                engine.add_fact(f"(P{i})IsA(estudiante)")
+                engine.add_fact(f"(P{i})ViveEn(Madrid) ∨ (P{i})ViveEn(Lima)")
+                engine.add_fact(f"¬(P{i})ViveEn(Lima)")
+            engine.add_rule("(X)IsA(estudiante) → (X)Estudia()")
+            engine.add_rule("(X)Estudia() → (X)Aprende()")
+            engine.add_rule("(X)ViveEn(Madrid) → (X)TieneMetro()")
+            result = engine.infer_all(verbose=False)
+            return engine, result
+        
+        serial_engine, serial = run(False)
+        parallel_engine, parallel = run(True)
+        assert parallel_engine.knowledge_base == serial_engine.knowledge_base, "KBs differ"
+        assert len(parallel_engine.knowledge_base) == len(set(map(str, parallel_engine.knowledge_base))), \
+            "Parallel inference should not add duplicate facts"
+        assert parallel_engine.query("(P7)TieneMetro()"), "Should derive (P7)TieneMetro()"
+        print(f"  ✓ Parallel and serial inference agree ({len(serial.derived_facts)} derived)")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Parallel inference error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_query_cache():
+    """Test that cached query answers follow knowledge base changes."""
+    print("\nTesting query caching...")
+    try:
+        import Text2Logic as t2l
+        
+        system = t2l.LogicSystem(auto_verify=False)
+        system.add_fact("(Pedro)IsA(estudiante)")
+        system.infer_all(verbose=False)
+        assert not system.query("(Bob)IsA(padre)"), "Unknown fact"
+        assert not system.query("(Pedro)Estudia()"), "Not derived yet"
+        
+        system.add_fact("(Bob)IsA(padre)")
+        system.add_rule("(X)IsA(estudiante) → (X)Estudia()")
+        assert system.query("(Bob)IsA(padre)"), "Cached answer should be dropped on add_fact"
+        system.infer_all(verbose=False)
+        assert system.query("(Pedro)Estudia()"), "Derived fact should be found"
+        assert system.query("(Pedro)Estudia()"), "Repeated query should agree"
+        print("  ✓ Query answers follow knowledge base changes")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Query cache error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_replaced_knowledge_base():
+    """Test that rule state does not leak into a replaced knowledge base."""
+    print("\nTesting knowledge base replacement...")
+    try:
+        from Text2Logic.logic_engine import LogicEngine
+        from Text2Logic.logic_parser import parse_expression
+        from Text2Logic.deduction_rules import RuleManager
+        
+        conjunction = "(a)R(b) ∧ (c)S(d)"
+        engine = LogicEngine()
+        engine.add_fact(conjunction)
+        engine.infer_all(verbose=False)
+        engine.knowledge_base = set()
+        engine.add_fact(conjunction)
+        engine.infer_all(verbose=False)
+        assert engine.query("(a)R(b)"), "Conjunction should be split again in the new set"
+        print("  ✓ LogicEngine resets rule state when knowledge_base is replaced")
+        
+        manager = RuleManager()
+        fact = parse_expression(conjunction)
+        other = parse_expression("(e)T()")
+        manager.apply_all_rules({fact}, incremental=True)
+        derived = {str(f) for f, _ in manager.apply_all_rules({fact, other}, incremental=True)}
+        assert derived == {"(a)R(b)", "(c)S(d)"}, f"Got {derived}"
+        print("  ✓ RuleManager resets rule state for a different set")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Knowledge base replacement error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_repeated_rule_application():
+    """Test that rules give the same derivations when applied again."""
+    print("\nTesting repeated rule application...")
+    try:
+        from Text2Logic.logic_parser import parse_expression
+        from Text2Logic.deduction_rules import RuleManager, Simplification
+        
+        kb = {parse_expression(text) for text in [
+            "(a)R(b) ∧ (c)S(d)",
+            "(X)EsMamifero() ↔ (X)TienePelo()",
+            "(a)P() ∨ (b)Q()",
+            "¬(a)P() ∨ (c)S()",
+        ]}
+        
+        manager = RuleManager()
+        first = [str(fact) for fact, _ in manager.apply_all_rules(kb)]
+        second = [str(fact) for fact, _ in manager.apply_all_rules(kb)]
+        assert first and first == second, f"{first} != {second}"
+        print(f"  ✓ apply_all_rules is repeatable ({len(first)} derivations)")
+        
+        rule = Simplification()
+        assert rule.apply(kb, set()) == rule.apply(kb, set()), "Simplification changed"
+        print("  ✓ Rule.apply is repeatable")
+        
+        def saturate(incremental):
+            facts = set(kb)
+            manager = RuleManager()
+            for _ in range(10):
+                derived = manager.apply_all_rules(facts, incremental=incremental)
+                if not derived:
+                    break
+                facts.update(fact for fact, _ in derived)
+            return facts
+        
+        assert saturate(True) == saturate(False), "Incremental fixpoint differs"
+        print("  ✓ Incremental calls reach the same fixpoint")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Repeated rule application error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_derivation_justification():
+    """Test that derivation justifications read as plain strings."""
+    print("\nTesting derivation justifications...")
+    try:
+        import json
+        import pickle
+        from Text2Logic.logic_engine import LogicEngine
+        
+        engine = LogicEngine()
+        engine.add_fact("(Pedro)IsA(estudiante)")
+        engine.add_rule("(X)IsA(estudiante) → (X)Estudia()")
+        result = engine.infer_all(verbose=False)
+        chain = result.derived_facts[0]
+        justification = chain.justification
+        assert isinstance(justification, str), f"Got {type(justification)}"
+        assert justification.startswith("Modus Ponens"), justification
+        json.dumps(justification)
+        assert justification + "!" == f"{justification}!"
+        assert justification in str(chain)
+        assert pickle.loads(pickle.dumps(chain)).justification == justification
+        print(f"  ✓ {justification}")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Derivation justification error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_verbose_output():
+    """Test that verbose progress follows sys.stdout redirects."""
+    print("\nTesting verbose output...")
+    try:
+        import contextlib
+        import io
+        from Text2Logic.logic_engine import LogicEngine
+        
+        def capture():
+            engine = LogicEngine()
+            engine.add_fact("(Pedro)IsA(estudiante)")
+            engine.add_rule("(X)IsA(estudiante) → (X)Estudia()")
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                engine.infer_all(verbose=True)
+            return buffer.getvalue()
+        
+        first, second = capture(), capture()
+        assert "(Pedro)Estudia()" in first, "First capture is missing the progress output"
+        assert second == first, "Second capture should get the same output"
+        print(f"  ✓ Both captures got the progress output ({len(second)} chars)")
+        
+        from Text2Logic import api
+        from Text2Logic.logic_engine import _console_logger
+        for attempt in range(2):
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                _console_logger(api._LOG).info("progress %d", attempt)
+            assert buffer.getvalue() == f"progress {attempt}\n", "API progress missed the redirect"
+        print("  ✓ API progress follows sys.stdout too")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Verbose output error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_inference_fixpoints():
+    """Test incremental inference against plain rounds of every rule over the whole KB."""
+    print("\nTesting inference fixpoints against full passes...")
+    try:
+        import random
+        from Text2Logic.logic_engine import LogicEngine
+        from Text2Logic.deduction_rules import RuleManager
+        
+        def expression(rng, operators=('∧', '∨', '→', '↔')):
+            def literal():
+                objects = ", ".join(rng.sample(['a', 'b'], rng.choice([0, 0, 1])))
+                atom = f"({rng.choice(['Pedro', 'Ana', 'Bob'])}){rng.choice('PQR')}({objects})"
+                return "¬" * rng.choice([0, 0, 1]) + atom
+            parts = [literal()]
+            for _ in range(rng.choice([0, 1, 1, 2])):
+                parts += [rng.choice(operators), literal()]
+            return " ".join(parts)
+        
+        def add_facts(engine, rng, count):
+            for _ in range(count):
+                try:
+                    engine.add_fact(expression(rng))
+                except Exception:
+                    pass
+        
+        def reference_rounds(knowledge_base, rounds, enable_conjunction):
+            # Every rule over the whole knowledge base, with no state kept
+            # between rounds: what inference did before it went incremental
+            facts = set(knowledge_base)
+            derived_by_round = []
+            for _ in range(rounds):
+                manager = RuleManager(enable_conjunction=enable_conjunction)
+                derived = {fact for fact, _ in manager.apply_all_rules(set(facts))}
+                if not derived:
+                    break
+                derived_by_round.append(derived)
+                facts |= derived
+            return derived_by_round
+        
+        cases = 150
+        for seed in range(cases):
+            rng = random.Random(seed)
+            rounds = rng.choice([2, 3, 4])
+            enable_conjunction = rng.random() < 0.3
+            engine = LogicEngine(max_iterations=rounds, enable_conjunction=enable_conjunction)
+            engine.rule_manager.max_workers = rng.choice([1, 4])
+            add_facts(engine, rng, rng.randint(1, 5))
+            for _ in range(rng.randint(0, 3)):
+                try:
+                    engine.add_rule(expression(rng, ('∧', '∨')) + " → " +
+                                    expression(rng, ('∧', '∨')))
+                except Exception:
+                    pass
+            if rng.random() < 0.5:
+                # A second run is seeded with the facts added since the first
+                engine.infer_all()
+                add_facts(engine, rng, rng.randint(1, 3))
+            
+            start = set(engine.knowledge_base)
+            known_chains = len(engine.derivation_chains)
+            result = engine.infer_all()
+            by_round = {}
+            for chain in result.derived_facts[known_chains:]:
+                by_round.setdefault(chain.depth, set()).add(chain.conclusion)
+            derived_by_round = [by_round[depth] for depth in sorted(by_round)]
+            
+            expected = reference_rounds(start, rounds, enable_conjunction)
+            assert derived_by_round == expected, f"Case {seed}: rounds differ"
+        print(f"  ✓ Same facts derived in each round for {cases} random knowledge bases")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Inference fixpoint error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_index_sync():
+    """Test that an index kept up to date matches one built from scratch."""
+    print("\nTesting knowledge base index sync...")
+    try:
+        from Text2Logic.logic_parser import parse_expression
+        from Text2Logic.deduction_rules import IndexedKB, KB_ALL
+        
+        batches = [[parse_expression(text) for text in batch] for batch in (
+            ["(Pedro)IsA(estudiante)", "¬(Ana)IsA(estudiante)", "(X)IsA(estudiante) → (X)Estudia()"],
+            ["(Ana)IsA(estudiante)", "(a)P() ∧ (b)Q()", "(a)P() → (c)R()"],
+            ["¬(Pedro)IsA(estudiante)", "(a)P() ∨ (b)Q()", "(a)P() ↔ (b)Q()"],
+        )]
+        
+        def layout(index):
+            return ({key: set(bucket) for key, bucket in index.items() if key != KB_ALL},
+                    set(index.contradictions), index.antecedent_kinds,
+                    {key: {fact for _, fact in entries}
+                     for key, entries in index.implications_by_head.items()})
+        
+        knowledge_base = set()
+        index = IndexedKB(knowledge_base)
+        for batch in batches:
+            knowledge_base.update(batch)
+            index.sync(set(batch))
+            assert layout(index) == layout(IndexedKB(set(knowledge_base))), "Synced index differs"
+        print("  ✓ Index extended by each batch matches a fresh index")
+        
+        generation = index.generation
+        knowledge_base.add(parse_expression("(Bob)IsA(padre)"))
+        index.sync(set())
+        assert index.generation != generation, "Unaccounted growth should reindex"
+        assert layout(index) == layout(IndexedKB(set(knowledge_base))), "Reindexed index differs"
+        print("  ✓ Unaccounted growth falls back to a full reindex")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Index sync error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_export_results():
+    """Test that streamed export writes what line-by-line writes did."""
+    print("\nTesting result export...")
+    try:
+        import io
+        import tempfile
+        from Text2Logic.logic_engine import LogicEngine, EXPORT_BATCH_LINES
+        
+        def reference_export(result):
+            # The export as written one line at a time, before batching
+            lines = ["╔" + "═" * 78 + "╗\n",
+                     "║                    INFERENCE RESULTS - LOGIC ENGINE                          ║\n",
+                     "╚" + "═" * 78 + "╝\n\n"]
+            lines += ["═" * 70 + "\n", "ORIGINAL FACTS\n", "═" * 70 + "\n"]
+            lines += [f"{fact}\n" for fact in sorted(result.original_facts, key=str)
+                      if fact not in result.original_rules]
+            lines += ["\n", "═" * 70 + "\n", "ORIGINAL RULES\n", "═" * 70 + "\n"]
+            lines += [f"{rule}\n" for rule in sorted(result.original_rules, key=str)]
+            lines += ["\n", "═" * 70 + "\n", "DERIVED FACTS (BY INFERENCE DEPTH)\n", "═" * 70 + "\n"]
+            by_depth = result.get_facts_by_depth()
+            for depth in sorted(by_depth):
+                lines.append(f"\n--- Depth {depth} ---\n")
+                for chain in by_depth[depth]:
+                    lines += [f"{chain.conclusion}\n", f"  ← {chain.justification}\n"]
+            lines += ["\n", "═" * 70 + "\n", "SUMMARY\n", "═" * 70 + "\n",
+                      f"Original facts: {len(result.original_facts) - len(result.original_rules)}\n",
+                      f"Original rules: {len(result.original_rules)}\n",
+                      f"Derived facts: {len(result.derived_facts)}\n",
+                      f"Total facts: {len(result.get_all_facts())}\n",
+                      f"Iterations: {result.iterations}\n"]
+            if result.contradictions:
+                lines += ["\n", "═" * 70 + "\n", "⚠️  CONTRADICTIONS DETECTED\n", "═" * 70 + "\n"]
+                lines += [f"{contradiction}\n" for contradiction in result.contradictions]
+            lines.append("\n" + "═" * 70 + "\n")
+            return "".join(lines)
+        
+        # Enough derivations to span several write batches
+        engine = LogicEngine()
+        engine.add_facts(f"(Persona{i})IsA(estudiante)" for i in range(EXPORT_BATCH_LINES))
+        engine.add_fact("¬(Persona0)Estudia()")
+        engine.add_rule("(X)IsA(estudiante) → (X)Estudia()")
+        result = engine.infer_all()
+        expected = reference_export(result)
+        
+        stream = io.StringIO()
+        engine.export_results(stream, result)
+        assert stream.getvalue() == expected, "Export to a stream differs"
+        print(f"  ✓ Export to a stream matches ({len(result.derived_facts)} derived facts)")
+        
+        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+            path = f.name
+        try:
+            engine.export_results(path, result)
+            with open(path, encoding='utf-8') as f:
+                assert f.read() == expected, "Export to a path differs"
+        finally:
+            os.remove(path)
+        print("  ✓ Export to a path matches")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Result export error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_conversion_window():
+    """Test the bounded, in-order conversion window (without Ollama)."""
+    print("\nTesting conversion window (without Ollama)...")
+    try:
+        import random
+        import threading
+        import time
+        from Text2Logic.text_to_logic import TextToLogicConverter
+        
+        converter = TextToLogicConverter()
+        converter.verified = True
+        lock = threading.Lock()
+        calls = []
+        
+        def fake_convert(sentence, max_retries=3):
+            with lock:
+                calls.append(sentence)
+            time.sleep(random.random() / 500)
+            name = sentence.split()[0]
+            return f"({name})IsA(estudiante)\nRule: ({name})IsA(estudiante) → ({name})Estudia()"
+        
+        converter.convert_sentence = fake_convert
+        names = [f"Persona{i % 7}" for i in range(40)]
+        text = " ".join(f"{name} es estudiante." for name in names)
+        sentences = converter.split_into_sentences(text)
+        
+        for workers in (1, 3):
+            drawn = [0]
+            
+            def draw():
+                for sentence in sentences:
+                    drawn[0] += 1
+                    yield sentence
+            
+            order = []
+            for sentence, result in converter._convert_in_order(draw(), workers):
+                order.append(sentence)
+                assert drawn[0] - len(order) < 2 * workers, "Window drew too far ahead"
+                assert result.startswith(f"({sentence.split()[0]})"), "Result paired with another sentence"
+            assert order == sentences, "Results out of sentence order"
+        print("  ✓ Results yielded in sentence order with a bounded window")
+        
+        sequential = converter.convert_text(text, verbose=False, max_concurrency=1)
+        concurrent = converter.convert_text(text, verbose=False, max_concurrency=4)
+        assert concurrent == sequential, "Concurrency changed the conversion"
+        assert len(sequential[0]) == len(names), "Every sentence should give a fact"
+        print("  ✓ convert_text output independent of max_concurrency")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Conversion window error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_analysis_dict():
+    """Test that an analysis' dictionary form can be modified by callers."""
+    print("\nTesting analysis dictionaries...")
+    try:
+        from Text2Logic.api import CompleteAnalysis, ConversionResult
+        from Text2Logic.logic_engine import LogicEngine
+        
+        engine = LogicEngine()
+        engine.add_fact("(Pedro)IsA(estudiante)")
+        engine.add_rule("(X)IsA(estudiante) → (X)Estudia()")
+        conversion = ConversionResult(["(Pedro)IsA(estudiante)"], ["(X)IsA(estudiante) → (X)Estudia()"],
+                                      "Pedro es estudiante.")
+        analysis = CompleteAnalysis(conversion, engine.infer_all())
+        
+        first = analysis.to_dict()
+        expected = {'original_facts_count': 1, 'original_rules_count': 1,
+                    'derived_facts_count': 1, 'iterations': 2, 'has_contradictions': False}
+        assert first['inference'] == expected, first['inference']
+        first['inference']['derived_facts_count'] = 0
+        first['extra'] = True
+        second = analysis.as_dict
+        assert second['inference'] == expected and 'extra' not in second, \
+            "Changes to a returned dictionary leaked into the next one"
+        print("  ✓ Each call returns a new dictionary with the same counts")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Analysis dictionary error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_analyze_texts_concurrency():
+    """Test that analyze_texts stays within the converter's HTTP pool (without Ollama)."""
+    print("\nTesting analyze_texts concurrency (without Ollama)...")
+    try:
+        import threading
+        import time
+        from Text2Logic import api
+        from Text2Logic.text_to_logic import HTTP_POOL_SIZE
+        
+        converter = api._get_converter("fake-model")
+        converter.verified = True
+        lock = threading.Lock()
+        active = [0, 0]  # current, highest
+        
+        def fake_convert(sentence, max_retries=3):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.002)
+            with lock:
+                active[0] -= 1
+            return f"({sentence.split()[0]})IsA(estudiante)"
+        
+        converter.convert_sentence = fake_convert
+        texts = [" ".join(f"Persona{i}x{j} es estudiante." for j in range(8)) for i in range(40)]
+        try:
+            for workers, limit in ((3, 3), (HTTP_POOL_SIZE * 2, HTTP_POOL_SIZE)):
+                active[1] = 0
+                analyses = api.analyze_texts(texts, model_name="fake-model", workers=workers)
+                assert len(analyses) == len(texts), "One analysis per text expected"
+                assert analyses[5].conversion.facts[0] == "(Persona5x0)IsA(estudiante)", \
+                    "Analyses out of text order"
+                assert active[1] <= limit, f"{active[1]} requests in flight with workers={workers}"
+        finally:
+            del api._CONVERTER_POOL["fake-model"]
+        print(f"  ✓ At most min(workers, {HTTP_POOL_SIZE}) requests in flight")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ analyze_texts concurrency error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_build_prompt():
+    """Test that prompts match str.format() for any template."""
+    print("\nTesting prompt building...")
+    try:
+        from Text2Logic.text_to_logic import TextToLogicConverter
+        
+        converter = TextToLogicConverter()
+        sentence = "Pedro {es} estudiante"
+        templates = [
+            converter.prompt_template,
+            "Convert {{exactly}} this: {sentence}\n{{done}}",
+            "{sentence} / {sentence}",
+            "{sentence!r}",
+            "{sentence:>30}",
+            "{sentence} in {language}",
+            "Unbalanced {sentence",
+        ]
+        for template in templates:
+            converter.prompt_template = template
+            try:
+                expected = template.format(sentence=sentence)
+            except (KeyError, ValueError) as e:
+                expected = type(e)
+            try:
+                prompt = converter._build_prompt(sentence)
+            except (KeyError, ValueError) as e:
+                prompt = type(e)
+            assert prompt == expected, f"{template!r}: {prompt!r} != {expected!r}"
+        print(f"  ✓ Same prompt as str.format() for {len(templates)} templates")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Prompt building error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_api_basic():
     """Test the API without Ollama."""
     print("\nTesting API (without Ollama)...")
@@ -220,6 +1056,24 @@ def main():
         ("Logic Parser", test_logic_parser),
         ("Logic Engine", test_logic_engine),
         ("Deduction Rules", test_deduction_rules),
+        ("Interning", test_interning),
+        ("Conversion Cache", test_convert_retries_failures),
+        ("Streamed Responses", test_streamed_response),
+        ("File Loading", test_load_from_file),
+        ("Input Text Reading", test_read_text_file),
+        ("Parallel Inference", test_parallel_inference),
+        ("Query Cache", test_query_cache),
+        ("Knowledge Base Replacement", test_replaced_knowledge_base),
+        ("Repeated Rule Application", test_repeated_rule_application),
+        ("Derivation Justifications", test_derivation_justification),
+        ("Verbose Output", test_verbose_output),
+        ("Inference Fixpoints", test_inference_fixpoints),
+        ("Index Sync", test_index_sync),
+        ("Result Export", test_export_results),
+        ("Conversion Window", test_conversion_window),
+        ("Analysis Dictionary", test_analysis_dict),
+        ("Batch Analysis Concurrency", test_analyze_texts_concurrency),
+        ("Prompt Building", test_build_prompt),
         ("API Basic", test_api_basic),
     ]
     
@@ -17,12 +17,236 @@ Version: 1.0 - Enhanced from nlp_to_inference.py
 # IMPORTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
 import re
 import json
 import requests
+import string
 import subprocess
 import sys
-from typing import List, Optional, Tuple, Dict
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SHARED CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Built once at import time and referenced by every converter instance
+DEFAULT_API_URL = "http://localhost:11434/api/generate"
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+OLLAMA_PS_URL = "http://localhost:11434/api/ps"
+OLLAMA_VERSION_URL = "http://localhost:11434/api/version"
+
+# Connections kept open per host by each HTTP session
+HTTP_POOL_SIZE = 16
+
+# Sentences of one text converted at the same time. Ollama batches up to
+# OLLAMA_NUM_PARALLEL concurrent requests per model into one forward pass
+# and queues the rest, so the default follows that variable when it is set
+# (start the server with the same value, e.g. OLLAMA_NUM_PARALLEL=8 ollama serve)
+FALLBACK_MAX_CONCURRENCY = 4
+
+
+def _parallel_from_env() -> Optional[int]:
+    """OLLAMA_NUM_PARALLEL as a positive int, or None if unset or invalid."""
+    try:
+        value = int(os.environ.get('OLLAMA_NUM_PARALLEL', ''))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+DEFAULT_MAX_CONCURRENCY = _parallel_from_env() or FALLBACK_MAX_CONCURRENCY
+
+# Converted sentences remembered by each converter (least recently used
+# entries are dropped first)
+CONVERSION_CACHE_SIZE = 1024
+
+# Semantic cache: a sentence reuses the conversion of one of the last
+# SEMANTIC_CACHE_SCAN sentences whose word sets overlap by at least
+# SEMANTIC_CACHE_THRESHOLD (Jaccard similarity)
+SEMANTIC_CACHE_THRESHOLD = 0.9
+SEMANTIC_CACHE_SCAN = 64
+
+# How long Ollama keeps the model (and its cached prompt prefix) loaded
+# after a request
+KEEP_ALIVE = "10m"
+
+# Sent as the system prompt of every request: it is byte-identical across
+# calls, so Ollama reuses its evaluated prefix instead of processing the
+# instructions and examples again for each sentence
+SYSTEM_PROMPT = """You are an expert in knowledge engineering. Your ONLY task is to convert sentences to formal logic notation.
+
+STRICT RULES:
+1. Output format MUST be: (Subject)RelationInCamelCase(Object)
+2. Subject and Object must be SINGLE words or short names - NO spaces, NO extra parentheses
+3. Relation must be CamelCase - NO spaces
+4. For simple facts: (Subject)Relation(Object)
+5. For logical rules with "if...then": Rule: (Subject)Relation(Object) -> (Subject2)Relation2(Object2)
+6. NEVER put parentheses inside Subject or Object
+7. NEVER use symbols like =, ∈, or operators inside atoms
+8. NO explanations - ONLY the logic lines
+9. If you cannot convert cleanly, output nothing
+
+### CORRECT Examples ###
+
+Input: Pedro is a student.
+Output: (Pedro)IsA(student)
+
+Input: The alarm rang at seven.
+Output: (Alarm)RanAt(seven)
+
+Input: Bob works at Microsoft.
+Output: (Bob)WorksAt(Microsoft)
+
+Input: If Pedro is a student then he studies.
+Output: Rule: (Pedro)IsA(student) -> (Pedro)Studies()
+
+Input: I made breakfast.
+Output: (I)Made(breakfast)
+
+Input: The sky was cloudy.
+Output: (Sky)Was(cloudy)
+
+### WRONG Examples (DO NOT DO THIS) ###
+
+WRONG: (El despertador)Sonó(a)a(las siete)en(punto)
+CORRECT: (Alarm)RanAt(seven)
+
+WRONG: (X)Fuerza(X) → (X)ViajóAlBaño
+CORRECT: Rule: (X)Went() -> (X)WentToBathroom()
+
+WRONG: (Persona) lavarse(cara) ∧ (Temperatura) = (Persona) despertarse
+CORRECT: Rule: (Person)Washed(face) -> (Person)WokeUp()
+
+### End of Examples ###
+"""
+
+# Per-sentence part of the prompt
+PROMPT_TEMPLATE = """Now convert this sentence (ONLY output logic lines, nothing else):
+{sentence}
+"""
+
+# Titles whose period does not end a sentence; one alternation, so
+# protecting them takes a single pass
+_ABBREVIATION_RE = re.compile(r'\b(Dr|Sr|Sra|Sres|Prof|Ing|Lic)\.')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+# Lines of a model response worth keeping: a rule or an atom
+_VALID_LINE_RE = re.compile(r'Rule:\s*\(|\([^)]+\)[A-Za-z_]')
+_WORD_RE = re.compile(r'\w+')
+
+
+def _is_valid_line(line: str) -> bool:
+    """Whether a stripped response line is a rule or an atom."""
+    # Only lines starting with "Rule:" or "(" can match, so the cheap
+    # prefix test rejects chatter before the regex runs
+    return line.startswith(('Rule:', '(')) and _VALID_LINE_RE.match(line) is not None
+
+
+def _sentence_key(sentence: str) -> str:
+    """Sentence with its whitespace normalized, as compared for reuse."""
+    return ' '.join(sentence.split())
+
+
+def _split_prompt_template(template: str) -> Tuple[Optional[str], str]:
+    """
+    Split a prompt template around its only field, a plain {sentence}.
+    
+    Args:
+        template: Template in str.format() syntax
+    
+    Returns:
+        (head, tail) with escaped braces undone, or (None, '') if the
+        template has any other fields, or is malformed
+    """
+    try:
+        parts = list(string.Formatter().parse(template))
+    except ValueError:
+        return None, ''
+    fields = [(name, spec, conversion) for _, name, spec, conversion in parts if name is not None]
+    if fields != [('sentence', '', None)]:
+        return None, ''
+    
+    head, tail = [], []
+    target = head
+    for literal, name, _, _ in parts:
+        target.append(literal)
+        if name is not None:
+            target = tail
+    return ''.join(head), ''.join(tail)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HTTP SESSIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _create_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Create an HTTP session that keeps connections to Ollama open.
+    
+    Requests sent through the same session reuse pooled keep-alive
+    connections instead of opening a new TCP connection per call.
+    Transport retries are disabled: callers retry at their own level.
+    
+    Args:
+        pool_size: Connections kept open per host
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Used by SystemVerifier checks when no session is passed in
+_SHARED_SESSION = _create_session()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FILE INPUT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+INPUT_ENCODINGS = ('utf-8', 'utf-16', 'latin-1', 'cp1252')
+
+
+def _read_text_file(path: str, encodings=INPUT_ENCODINGS) -> Optional[str]:
+    """
+    Read a text file once and decode it.
+    
+    The bytes are read once and each candidate encoding is tried on them,
+    instead of reopening and re-reading the file per encoding. Works for
+    pipes and FIFOs too. Newlines are normalized the same way text-mode
+    open() does.
+    
+    Args:
+        path: Path to the text file
+        encodings: Encodings to try, in order
+    
+    Returns:
+        Decoded text, or None if the file is missing or no encoding fits
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    
+    for encoding in encodings:
+        try:
+            text = data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+    return None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -59,18 +283,18 @@ class SystemVerifier:
             return False, f"Error checking Ollama: {e}"
     
     @staticmethod
-    def check_ollama_running() -> Tuple[bool, str]:
+    def check_ollama_running(session: Optional[requests.Session] = None) -> Tuple[bool, str]:
         """
         Check if Ollama service is running.
         
+        Args:
+            session: HTTP session to use (the shared module session if omitted)
+        
         Returns:
             Tuple of (is_running, message)
         """
         try:
-            response = requests.get(
-                "http://localhost:11434/api/tags",
-                timeout=5
-            )
+            response = (session or _SHARED_SESSION).get(OLLAMA_TAGS_URL, timeout=5)
             if response.status_code == 200:
                 return True, "Ollama service is running"
             else:
@@ -81,21 +305,46 @@ class SystemVerifier:
             return False, f"Error connecting to Ollama: {e}"
     
     @staticmethod
-    def check_gemma_installed(model_name: str = "gemma:2b") -> Tuple[bool, str]:
+    def check_ollama_service(session: Optional[requests.Session] = None) -> Tuple[bool, str]:
+        """
+        Check that Ollama answers over HTTP and get its version (GET /api/version).
+        
+        A reply proves both that Ollama is installed and that the service is
+        running, without starting the ollama CLI in a subprocess.
+        
+        Args:
+            session: HTTP session to use (the shared module session if omitted)
+        
+        Returns:
+            Tuple of (is_running, message)
+        """
+        try:
+            response = (session or _SHARED_SESSION).get(OLLAMA_VERSION_URL, timeout=5)
+            if response.status_code == 200:
+                version = response.json().get('version', 'unknown version')
+                return True, f"Ollama {version} installed and running"
+            else:
+                return False, f"Ollama service returned status {response.status_code}"
+        except requests.exceptions.ConnectionError:
+            return False, "Cannot connect to Ollama. Please run: ollama serve"
+        except Exception as e:
+            return False, f"Error connecting to Ollama: {e}"
+    
+    @staticmethod
+    def check_gemma_installed(model_name: str = "gemma:2b",
+                              session: Optional[requests.Session] = None) -> Tuple[bool, str]:
         """
         Check if specified Gemma model is installed.
         
         Args:
             model_name: Name of the model to check
+            session: HTTP session to use (the shared module session if omitted)
         
         Returns:
             Tuple of (is_installed, message)
         """
         try:
-            response = requests.get(
-                "http://localhost:11434/api/tags",
-                timeout=5
-            )
+            response = (session or _SHARED_SESSION).get(OLLAMA_TAGS_URL, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 models = data.get('models', [])
@@ -112,13 +361,53 @@ class SystemVerifier:
         except Exception as e:
             return False, f"Error checking models: {e}"
     
+    @staticmethod
+    def check_model_loaded(model_name: str = "gemma:2b",
+                           session: Optional[requests.Session] = None) -> Tuple[bool, str]:
+        """
+        Check whether the model is currently loaded in Ollama (GET /api/ps).
+        
+        Args:
+            model_name: Name of the model to check
+            session: HTTP session to use (the shared module session if omitted)
+        
+        Returns:
+            Tuple of (is_loaded, message)
+        """
+        try:
+            response = (session or _SHARED_SESSION).get(OLLAMA_PS_URL, timeout=5)
+            if response.status_code != 200:
+                return False, f"Could not retrieve running models (status {response.status_code})"
+            names = [m.get('name', '') for m in response.json().get('models', [])]
+            if model_name in names or f"{model_name}:latest" in names:
+                return True, f"Model {model_name} is loaded"
+            return False, f"Model {model_name} is not loaded yet (it loads on first use)"
+        except Exception as e:
+            return False, f"Error checking running models: {e}"
+    
+    @staticmethod
+    def describe_parallelism() -> str:
+        """
+        Describe how many sentences are converted concurrently and why.
+        
+        Returns:
+            Message naming the concurrency and its OLLAMA_NUM_PARALLEL source
+        """
+        if _parallel_from_env() is None:
+            return (f"OLLAMA_NUM_PARALLEL not set: converting {DEFAULT_MAX_CONCURRENCY} "
+                    f"sentences at a time (for more, run: export OLLAMA_NUM_PARALLEL=8; ollama serve)")
+        return (f"OLLAMA_NUM_PARALLEL={DEFAULT_MAX_CONCURRENCY}: converting "
+                f"{DEFAULT_MAX_CONCURRENCY} sentences at a time")
+    
     @classmethod
-    def verify_system(cls, model_name: str = "gemma:2b") -> Tuple[bool, List[str]]:
+    def verify_system(cls, model_name: str = "gemma:2b",
+                      session: Optional[requests.Session] = None) -> Tuple[bool, List[str]]:
         """
         Perform complete system verification.
         
         Args:
             model_name: Name of the model to verify
+            session: HTTP session for the service checks (shared one if omitted)
         
         Returns:
             Tuple of (all_ok, messages)
@@ -126,25 +415,29 @@ class SystemVerifier:
         messages = []
         all_ok = True
         
-        # Check Ollama installed
-        is_installed, msg = cls.check_ollama_installed()
-        messages.append(f"{'✓' if is_installed else '✗'} {msg}")
-        if not is_installed:
-            all_ok = False
-            return all_ok, messages
-        
-        # Check Ollama running
-        is_running, msg = cls.check_ollama_running()
-        messages.append(f"{'✓' if is_running else '✗'} {msg}")
+        # Check Ollama installed and running in one request
+        is_running, msg = cls.check_ollama_service(session)
         if not is_running:
+            # Only now run the CLI, to tell a missing install from a stopped service
+            is_installed, install_msg = cls.check_ollama_installed()
+            messages.append(f"{'✓' if is_installed else '✗'} {install_msg}")
+            if is_installed:
+                messages.append(f"✗ {msg}")
             all_ok = False
             return all_ok, messages
+        messages.append(f"✓ {msg}")
         
         # Check Gemma installed
-        has_model, msg = cls.check_gemma_installed(model_name)
+        has_model, msg = cls.check_gemma_installed(model_name, session)
         messages.append(f"{'✓' if has_model else '✗'} {msg}")
         if not has_model:
             all_ok = False
+            return all_ok, messages
+        
+        # Informational only: a model that is not loaded yet is still usable
+        is_loaded, msg = cls.check_model_loaded(model_name, session)
+        messages.append(f"{'✓' if is_loaded else '•'} {msg}")
+        messages.append(f"• {cls.describe_parallelism()}")
         
         return all_ok, messages
 
@@ -168,6 +461,9 @@ class TextToLogicConverter:
         >>> converter = TextToLogicConverter()
         >>> converter.verify_dependencies()
         >>> facts, rules = converter.convert_text("Si Pedro es estudiante entonces estudia")
+    
+    The converter keeps its HTTP connections open between calls; use it as
+    a context manager (or call close()) to release them.
     """
     
     # Logical connectives in Spanish
@@ -182,18 +478,43 @@ class TextToLogicConverter:
         'equivale a': '↔',
     }
     
-    def __init__(self, model_name: str = "gemma:2b", api_url: str = "http://localhost:11434/api/generate"):
+    def __init__(self, model_name: str = "gemma:2b", api_url: str = DEFAULT_API_URL,
+                 semantic_cache: bool = False):
         """
         Initialize the enhanced text to logic converter.
         
         Args:
             model_name: Ollama model to use
             api_url: Ollama API endpoint
+            semantic_cache: Reuse the conversion of a recent sentence with
+                nearly the same words (faster on repetitive text, but two
+                such sentences may deserve different conversions)
         """
         self.model_name = model_name
         self.api_url = api_url
+        self.system_prompt = SYSTEM_PROMPT
         self.prompt_template = self._create_prompt_template()
+        # (template, text before {sentence}, text after it), see _build_prompt()
+        self._prompt_parts = (None, '', '')
         self.verified = False
+        self.session = _create_session()
+        self.semantic_cache = semantic_cache
+        # Conversions by whitespace-normalized sentence, and by the word set
+        # of the sentence for the semantic cache; shared by the threads of
+        # convert_text, hence the lock
+        self._exact_cache = OrderedDict()
+        self._semantic_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def verify_dependencies(self) -> bool:
         """
@@ -206,7 +527,7 @@ class TextToLogicConverter:
         print("║                    SYSTEM VERIFICATION                                       ║")
         print("╚══════════════════════════════════════════════════════════════════════════════╝\n")
         
-        all_ok, messages = SystemVerifier.verify_system(self.model_name)
+        all_ok, messages = SystemVerifier.verify_system(self.model_name, self.session)
         
         for msg in messages:
             print(f"  {msg}")
@@ -233,55 +554,7 @@ class TextToLogicConverter:
         Returns:
             Prompt template string
         """
-        return """You are an expert in knowledge engineering. Your ONLY task is to convert sentences to formal logic notation.
-
-STRICT RULES:
-1. Output format MUST be: (Subject)RelationInCamelCase(Object)
-2. Subject and Object must be SINGLE words or short names - NO spaces, NO extra parentheses
-3. Relation must be CamelCase - NO spaces
-4. For simple facts: (Subject)Relation(Object)
-5. For logical rules with "if...then": Rule: (Subject)Relation(Object) -> (Subject2)Relation2(Object2)
-6. NEVER put parentheses inside Subject or Object
-7. NEVER use symbols like =, ∈, or operators inside atoms
-8. NO explanations - ONLY the logic lines
-9. If you cannot convert cleanly, output nothing
-
-### CORRECT Examples ###
-
-Input: Pedro is a student.
-Output: (Pedro)IsA(student)
-
-Input: The alarm rang at seven.
-Output: (Alarm)RanAt(seven)
-
-Input: Bob works at Microsoft.
-Output: (Bob)WorksAt(Microsoft)
-
-Input: If Pedro is a student then he studies.
-Output: Rule: (Pedro)IsA(student) -> (Pedro)Studies()
-
-Input: I made breakfast.
-Output: (I)Made(breakfast)
-
-Input: The sky was cloudy.
-Output: (Sky)Was(cloudy)
-
-### WRONG Examples (DO NOT DO THIS) ###
-
-WRONG: (El despertador)Sonó(a)a(las siete)en(punto)
-CORRECT: (Alarm)RanAt(seven)
-
-WRONG: (X)Fuerza(X) → (X)ViajóAlBaño
-CORRECT: Rule: (X)Went() -> (X)WentToBathroom()
-
-WRONG: (Persona) lavarse(cara) ∧ (Temperatura) = (Persona) despertarse
-CORRECT: Rule: (Person)Washed(face) -> (Person)WokeUp()
-
-### End of Examples ###
-
-Now convert this sentence (ONLY output logic lines, nothing else):
-{sentence}
-"""
+        return PROMPT_TEMPLATE
     
     def split_into_sentences(self, text: str) -> List[str]:
         """
@@ -293,18 +566,31 @@ Now convert this sentence (ONLY output logic lines, nothing else):
         Returns:
             List of sentences
         """
-        # Replace common abbreviations to avoid false splits
-        text = re.sub(r'\bDr\.', 'Dr', text)
-        text = re.sub(r'\bSr\.', 'Sr', text)
-        text = re.sub(r'\bSra\.', 'Sra', text)
-        
-        # Split on sentence endings
-        sentences = re.split(r'[.!?]+', text)
+        return list(self.iter_sentences(text))
+    
+    def iter_sentences(self, text: str) -> Iterator[str]:
+        """
+        Yield the sentences of split_into_sentences() one at a time.
         
-        # Clean and filter
-        sentences = [s.strip() for s in sentences if s.strip()]
+        Args:
+            text: Input text
         
-        return sentences
+        Returns:
+            Iterator over the sentences, found as it advances
+        """
+        # Drop the period of common abbreviations to avoid false splits
+        text = _ABBREVIATION_RE.sub(r'\1', text)
+        
+        # Cut at sentence endings, then clean and filter
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(text):
+            sentence = text[start:match.start()].strip()
+            if sentence:
+                yield sentence
+            start = match.end()
+        sentence = text[start:].strip()
+        if sentence:
+            yield sentence
     
     def detect_logical_structure(self, sentence: str) -> Dict[str, bool]:
         """
@@ -318,12 +604,16 @@ Now convert this sentence (ONLY output logic lines, nothing else):
         """
         sentence_lower = sentence.lower()
         
+        # Plain substring tests chained with `or`: each is a single C-level
+        # scan that stops at the first hit ('no es' needs no test of its
+        # own, it contains 'no ')
         return {
-            'has_implication': any(word in sentence_lower for word in ['si', 'entonces', 'luego', 'por lo tanto']),
-            'has_biconditional': any(phrase in sentence_lower for phrase in ['si y solo si', 'equivale a']),
+            'has_implication': ('si' in sentence_lower or 'entonces' in sentence_lower or
+                                'luego' in sentence_lower or 'por lo tanto' in sentence_lower),
+            'has_biconditional': 'si y solo si' in sentence_lower or 'equivale a' in sentence_lower,
             'has_conjunction': ' y ' in sentence_lower,
             'has_disjunction': ' o ' in sentence_lower,
-            'has_negation': any(word in sentence_lower for word in ['no es', 'no ', 'nunca']),
+            'has_negation': 'no ' in sentence_lower or 'nunca' in sentence_lower,
         }
     
     def convert_sentence(self, sentence: str, max_retries: int = 3) -> Optional[str]:
@@ -337,30 +627,83 @@ Now convert this sentence (ONLY output logic lines, nothing else):
         Returns:
             Converted logic notation or None if failed
         """
-        prompt = self.prompt_template.format(sentence=sentence)
+        key = _sentence_key(sentence)
+        fingerprint = frozenset(_WORD_RE.findall(key.lower())) if self.semantic_cache else None
+        cached = self._cached_conversion(key, fingerprint)
+        if cached is not None:
+            return cached
+        
+        result = self._request_conversion(sentence, max_retries)
+        if result is not None:
+            self._store_conversion(key, fingerprint, result)
+        return result
+    
+    def _cached_conversion(self, key: str, fingerprint: Optional[frozenset]) -> Optional[str]:
+        """
+        Look up an earlier conversion of a sentence.
+        
+        Args:
+            key: Whitespace-normalized sentence
+            fingerprint: Word set of the sentence (None to skip the semantic cache)
+        
+        Returns:
+            Cached conversion, or None on a miss
+        """
+        with self._cache_lock:
+            result = self._exact_cache.get(key)
+            if result is not None:
+                self._exact_cache.move_to_end(key)
+                return result
+            
+            if not fingerprint:
+                return None
+            for candidate, result in islice(reversed(self._semantic_cache.items()),
+                                            SEMANTIC_CACHE_SCAN):
+                if (len(fingerprint & candidate) / len(fingerprint | candidate)
+                        >= SEMANTIC_CACHE_THRESHOLD):
+                    self._semantic_cache.move_to_end(candidate)
+                    return result
+        return None
+    
+    def _store_conversion(self, key: str, fingerprint: Optional[frozenset], result: str):
+        """Remember a successful conversion, evicting the least recently used."""
+        with self._cache_lock:
+            caches = [(self._exact_cache, key)]
+            if fingerprint:
+                caches.append((self._semantic_cache, fingerprint))
+            for cache, cache_key in caches:
+                cache[cache_key] = result
+                cache.move_to_end(cache_key)
+                if len(cache) > CONVERSION_CACHE_SIZE:
+                    cache.popitem(last=False)
+    
+    def _request_conversion(self, sentence: str, max_retries: int) -> Optional[str]:
+        """Ask the model to convert a sentence (see convert_sentence())."""
+        prompt = self._build_prompt(sentence)
         
         for attempt in range(max_retries):
             try:
-                response = requests.post(
+                with self.session.post(
                     self.api_url,
                     json={
                         "model": self.model_name,
+                        "system": self.system_prompt,
                         "prompt": prompt,
-                        "stream": False,
-                        "temperature": 0.1
+                        "stream": True,
+                        "keep_alive": KEEP_ALIVE,
+                        "options": {"temperature": 0.1}
                     },
+                    stream=True,
                     timeout=30
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    inference_text = result.get("response", "").strip()
-                    inference_text = self._clean_response(inference_text)
-                    
-                    if inference_text:
-                        return inference_text
+                ) as response:
+                    if response.status_code == 200:
+                        inference_text = self._read_streamed_response(response)
+                        
+                        if inference_text:
+                            return inference_text
                 
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # ValueError: a malformed or truncated NDJSON chunk
                 if attempt == max_retries - 1:
                     print(f"Error after {max_retries} attempts: {e}")
                     return None
@@ -368,6 +711,56 @@ Now convert this sentence (ONLY output logic lines, nothing else):
         
         return None
     
+    def _read_streamed_response(self, response: requests.Response) -> str:
+        """
+        Collect the valid inference lines of a streamed generation.
+        
+        Lines are validated as the model produces them, up to the final
+        chunk. Valid lines that follow commentary are kept as well, so the
+        result is what _clean_response() gives for the full response text.
+        
+        Args:
+            response: Streaming /api/generate response (NDJSON chunks)
+        
+        Returns:
+            Cleaned inference text
+        """
+        valid_lines = []
+        pending = ''
+        for raw in response.iter_lines():
+            if not raw:
+                continue
+            chunk = json.loads(raw)
+            *lines, pending = (pending + chunk.get('response', '')).split('\n')
+            valid_lines.extend(line for line in map(str.strip, lines)
+                               if _is_valid_line(line))
+            if chunk.get('done'):
+                break
+        
+        line = pending.strip()
+        if _is_valid_line(line):
+            valid_lines.append(line)
+        return '\n'.join(valid_lines)
+    
+    def _build_prompt(self, sentence: str) -> str:
+        """
+        Fill the prompt template with a sentence.
+        
+        Same result as prompt_template.format(sentence=sentence). When
+        {sentence} is the template's only field, the template is split
+        around it once and each prompt is a plain concatenation; other
+        templates are formatted per call. The split is redone if
+        prompt_template has been replaced.
+        """
+        template, head, tail = self._prompt_parts
+        if template is not self.prompt_template:
+            template = self.prompt_template
+            head, tail = _split_prompt_template(template)
+            self._prompt_parts = (template, head, tail)
+        if head is None:
+            return template.format(sentence=sentence)
+        return head + sentence + tail
+    
     def _clean_response(self, text: str) -> str:
         """
         Clean LLM response to extract only valid inference lines.
@@ -378,75 +771,131 @@ Now convert this sentence (ONLY output logic lines, nothing else):
         Returns:
             Cleaned inference text
         """
-        lines = text.split('\n')
-        valid_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Check if line is a valid inference or rule
-            if re.match(r'Rule:\s*\(', line) or re.match(r'\([^)]+\)[A-Za-z_]', line):
-                valid_lines.append(line)
+        valid_lines = [line for line in map(str.strip, text.split('\n'))
+                       if _is_valid_line(line)]
         
         return '\n'.join(valid_lines)
     
-    def convert_text(self, text: str, verbose: bool = True) -> Tuple[List[str], List[str]]:
+    def convert_text(self, text: str, verbose: bool = True,
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Tuple[List[str], List[str]]:
         """
         Convert entire text to logic format.
         
+        Sentences are sent to Ollama concurrently as they are split off the
+        text; results are collected in sentence order, so the output does
+        not depend on max_concurrency.
+        
         Args:
             text: Input text
             verbose: Print progress
+            max_concurrency: Maximum number of sentences converted at once
+                (1 converts them one after another)
         
         Returns:
-            Tuple of (facts, rules)
+            Tuple of (facts, rules); rules are returned without the "Rule:" prefix
         """
         if not self.verified:
             print("⚠️  Warning: Dependencies not verified. Run verify_dependencies() first.")
         
-        sentences = self.split_into_sentences(text)
         all_facts = []
         all_rules = []
         
         if verbose:
-            print(f"Processing {len(sentences)} sentences...\n")
+            # Progress lines need the sentence count up front
+            sentences = self.split_into_sentences(text)
+            total = len(sentences)
+            print(f"Processing {total} sentences...\n")
             print("=" * 70)
+        else:
+            sentences = self.iter_sentences(text)
+            total = None
         
-        for i, sentence in enumerate(sentences, 1):
-            if verbose:
-                print(f"\n[{i}/{len(sentences)}] {sentence}")
+        results = self._convert_in_order(sentences, max(1, max_concurrency))
+        for i, (sentence, result) in enumerate(results, 1):
+            self._collect_result(i, total, sentence, result,
+                                 all_facts, all_rules, verbose)
+        
+        if verbose:
+            print("\n" + "=" * 70)
+            print(f"Conversion complete: {len(all_facts)} facts, {len(all_rules)} rules")
+        
+        return all_facts, all_rules
+    
+    def _convert_in_order(self, sentences: Iterable[str],
+                          workers: int) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Convert sentences on a thread pool, yielding results in input order.
+        
+        Sentences are drawn from the iterable only as room frees up: at most
+        twice as many as there are workers are in flight, so splitting a
+        long text overlaps with the conversions and memory stays bounded.
+        A sentence repeated within that window shares the request already
+        in flight; repeats further apart are answered by the conversion
+        cache of convert_sentence().
+        
+        Args:
+            sentences: Sentences to convert
+            workers: Number of concurrent conversions
+        
+        Returns:
+            Iterator over (sentence, conversion or None)
+        """
+        pending = deque()
+        # Distinct sentences in the window: [future, number of pending uses],
+        # dropped with their last use so the map stays as small as the window
+        in_flight = {}
+        
+        def next_result():
+            sentence, key = pending.popleft()
+            entry = in_flight[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del in_flight[key]
+            return sentence, entry[0].result()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for sentence in sentences:
+                key = _sentence_key(sentence)
+                entry = in_flight.get(key)
+                if entry is None:
+                    entry = in_flight[key] = [executor.submit(self.convert_sentence, sentence), 0]
+                entry[1] += 1
+                pending.append((sentence, key))
+                if len(pending) >= 2 * workers:
+                    yield next_result()
+            while pending:
+                yield next_result()
+    
+    def _collect_result(self, index: int, total: Optional[int], sentence: str, result: Optional[str],
+                        all_facts: List[str], all_rules: List[str], verbose: bool):
+        """Report one converted sentence and sort its lines into facts and rules."""
+        if verbose:
+            print(f"\n[{index}/{total}] {sentence}")
             
             # Detect logical structure
             structure = self.detect_logical_structure(sentence)
             
-            if verbose and any(structure.values()):
+            if any(structure.values()):
                 detected = [k.replace('has_', '') for k, v in structure.items() if v]
                 print(f"  Detected: {', '.join(detected)}")
-            
-            # Convert
-            result = self.convert_sentence(sentence)
-            
-            if result:
-                if verbose:
-                    print(f"  → {result.replace(chr(10), chr(10) + '     ')}")
-                
-                # Separate facts and rules
-                for line in result.split('\n'):
-                    if line.strip().startswith('Rule:'):
-                        all_rules.append(line.strip())
-                    else:
-                        all_facts.append(line.strip())
-            else:
-                if verbose:
-                    print(f"  → (Could not convert)")
         
-        if verbose:
-            print("\n" + "=" * 70)
-            print(f"Conversion complete: {len(all_facts)} facts, {len(all_rules)} rules")
-        
-        return all_facts, all_rules
+        if result:
+            if verbose:
+                print(f"  → {result.replace(chr(10), chr(10) + '     ')}")
+            
+            # Separate facts and rules
+            for line in result.split('\n'):
+                line = line.strip()
+                if line.startswith('Rule:'):
+                    all_rules.append(line[5:].lstrip())
+                else:
+                    all_facts.append(line)
+        else:
+            if verbose:
+                print(f"  → (Could not convert)")
     
-    def convert_file(self, input_file: str, output_file: str, verbose: bool = True):
+    def convert_file(self, input_file: str, output_file: str,
+                     verbose: bool = True) -> Tuple[List[str], List[str]]:
         """
         Convert a text file to .inf format.
         
@@ -454,24 +903,21 @@ Now convert this sentence (ONLY output logic lines, nothing else):
             input_file: Path to input text file
             output_file: Path to output .inf file
             verbose: Print progress
+        
+        Returns:
+            Tuple of (facts, rules) as written to the output file, rules
+            without the "Rule:" prefix
         """
         # Read input file with multiple encoding support
-        encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
-        text = None
-        
-        for encoding in encodings:
-            try:
-                with open(input_file, 'r', encoding=encoding) as f:
-                    text = f.read()
-                break
-            except (UnicodeDecodeError, FileNotFoundError):
-                continue
+        text = _read_text_file(input_file)
         
         if text is None:
             raise ValueError(f"Could not read file: {input_file}")
         
         # Convert
         facts, rules = self.convert_text(text, verbose=verbose)
+        facts = [fact for fact in facts if fact]
+        rules = [rule for rule in rules if rule]
         
         # Write output
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -485,8 +931,7 @@ Now convert this sentence (ONLY output logic lines, nothing else):
                 f.write("# FACTS\n")
                 f.write("# ═════════════════════════════════════════════════════════════\n\n")
                 for fact in facts:
-                    if fact:
-                        f.write(fact + "\n")
+                    f.write(fact + "\n")
                 f.write("\n")
             
             if rules:
@@ -494,11 +939,12 @@ Now convert this sentence (ONLY output logic lines, nothing else):
                 f.write("# RULES\n")
                 f.write("# ═════════════════════════════════════════════════════════════\n\n")
                 for rule in rules:
-                    if rule:
-                        f.write(rule + "\n")
+                    f.write("Rule: " + rule + "\n")
         
         if verbose:
             print(f"\n✓ Output saved to: {output_file}")
+        
+        return facts, rules
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -508,6 +954,14 @@ Now convert this sentence (ONLY output logic lines, nothing else):
 if __name__ == "__main__":
     """Test the text to logic converter."""
     
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description="Test the text to logic converter")
+    arg_parser.add_argument('--parallel', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                            help="Sentences converted concurrently (default: "
+                                 "OLLAMA_NUM_PARALLEL, else %(default)s)")
+    args = arg_parser.parse_args()
+    
     print("╔══════════════════════════════════════════════════════════════════════════════╗")
     print("║              TEXT TO LOGIC CONVERTER - TEST SUITE                            ║")
     print("╚══════════════════════════════════════════════════════════════════════════════╝\n")
@@ -526,7 +980,7 @@ if __name__ == "__main__":
     Bob trabaja en Microsoft y es padre de Pedro. Si alguien es estudiante y vive en Madrid entonces tiene metro.
     """
     
-    facts, rules = converter.convert_text(test_text, verbose=True)
+    facts, rules = converter.convert_text(test_text, verbose=True, max_concurrency=args.parallel)
     
     print("\n" + "=" * 70)
     print("EXTRACTED FACTS:")